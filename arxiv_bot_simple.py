@@ -12,49 +12,92 @@ For licensing inquiries, contact: sreeram.lagisetty@gmail.com
 
 import os
 import sys
-import arxiv
-import requests
+import asyncio
+import atexit
+import gzip
+import importlib.util
+import shutil
 import smtplib
 import schedule
 import time
 import json
 import yaml
 import logging
-from datetime import datetime, timedelta
+import select
+import socket
+import threading
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
 import re
 
-# Try to import AI libraries (optional)
-try:
-    from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
-    import torch
-    AI_AVAILABLE = True
-except ImportError:
-    AI_AVAILABLE = False
+# Heavy optional libraries are only probed here; they are imported where they
+# are used so that --help, --test and --trigger start quickly
+def _module_available(*names: str) -> bool:
+    """Check whether modules are installed without importing them"""
+    return all(importlib.util.find_spec(name) is not None for name in names)
+
+
+AI_AVAILABLE = _module_available('transformers', 'torch')
+if not AI_AVAILABLE:
     print("AI libraries not available. Install with: pip install transformers torch")
 
-# Try to import Telegram (optional)
+# ONNX Runtime (optional, faster CPU inference)
+ONNX_AVAILABLE = _module_available('optimum', 'onnxruntime')
+
+TELEGRAM_AVAILABLE = _module_available('telegram')
+if not TELEGRAM_AVAILABLE:
+    print("Telegram not available. Install with: pip install python-telegram-bot")
+
+SLACK_AVAILABLE = _module_available('slack_sdk')
+if not SLACK_AVAILABLE:
+    print("Slack not available. Install with: pip install slack-sdk")
+
+# Try to import Aho-Corasick (optional, faster multi-keyword matching)
 try:
-    from telegram import Bot
-    TELEGRAM_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    TELEGRAM_AVAILABLE = False
-    print("Telegram not available. Install with: pip install python-telegram-bot")
+    AHOCORASICK_AVAILABLE = False
 
-# Try to import Slack (optional)
+# Try to import orjson (optional, faster JSON serialization)
 try:
-    from slack_sdk.webhook import WebhookClient
-    SLACK_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    SLACK_AVAILABLE = False
-    print("Slack not available. Install with: pip install slack-sdk")
+    ORJSON_AVAILABLE = False
 
+# Text cleanup patterns, compiled once for all papers
+_WHITESPACE_RE = re.compile(r'\s+')
+_MATH_RE = re.compile(r'\$[^$]*\$')
+_LATEX_RE = re.compile(r'\\[a-zA-Z]+\{[^}]*\}')
 
-@dataclass
+# Sentence boundary used by the extractive fallback summary
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+# ArXiv API policy: at most one request every 3 seconds
+ARXIV_REQUEST_INTERVAL = 3.0
+
+# Delivered IDs are kept this many days past publication (longer if days_lookback is)
+SEEN_RETENTION_DAYS = 30
+
+# Telegram allows about one message per second in a chat
+TELEGRAM_MESSAGE_INTERVAL = 1.0
+TELEGRAM_SEND_ATTEMPTS = 3
+
+# Written last into a converted ONNX model directory; directories without it are
+# leftovers of an interrupted export and get rebuilt
+_ONNX_COMPLETE_MARKER = '.complete'
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+ only)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Paper:
     """Represents an ArXiv paper"""
     title: str
@@ -66,25 +109,26 @@ class Paper:
     pdf_url: str
     entry_id: str
     summary: Optional[str] = None
+    search_text: str = field(default='', init=False, repr=False)
     
     def __post_init__(self):
         """Clean up title and abstract"""
         self.title = self._clean_text(self.title)
         self.abstract = self._clean_text(self.abstract)
+        self.search_text = f"{self.title} {self.abstract}"
     
     def _clean_text(self, text: str) -> str:
         """Clean up text by removing extra whitespace and line breaks"""
-        text = re.sub(r'\s+', ' ', text.strip())
-        text = re.sub(r'\$[^$]*\$', '', text)  # Remove math expressions
-        text = re.sub(r'\\[a-zA-Z]+\{[^}]*\}', '', text)  # Remove LaTeX commands
+        text = _WHITESPACE_RE.sub(' ', text.strip())
+        text = _MATH_RE.sub('', text)  # Remove math expressions
+        text = _LATEX_RE.sub('', text)  # Remove LaTeX commands
         return text.strip()
     
-    def matches_keywords(self, keywords: List[str]) -> bool:
-        """Check if paper matches any of the provided keywords"""
-        if not keywords:
+    def matches_keywords(self, pattern) -> bool:
+        """Check if paper matches the compiled keyword matcher (see compile_keyword_pattern)"""
+        if pattern is None:
             return True
-        text_to_search = f"{self.title} {self.abstract}".lower()
-        return any(keyword.lower() in text_to_search for keyword in keywords)
+        return pattern.search(self.search_text) is not None
     
     def to_dict(self) -> Dict:
         """Convert paper to dictionary format"""
@@ -101,6 +145,91 @@ class Paper:
         }
 
 
+class KeywordAutomaton:
+    """Aho-Corasick matcher over lowercased keywords with a re.Pattern-like search()"""
+    
+    def __init__(self, keywords: List[str]):
+        self._automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            self._automaton.add_word(keyword.lower(), keyword)
+        self._automaton.make_automaton()
+    
+    def search(self, text: str):
+        """Return the first keyword hit in text, or None"""
+        return next(self._automaton.iter(text.lower()), None)
+
+
+def compile_keyword_pattern(keywords: List[str]):
+    """
+    Compile keywords into one matcher so each paper is scanned once (None matches everything)
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise a
+    single case-insensitive regex alternation.
+    """
+    if not keywords:
+        return None
+    if AHOCORASICK_AVAILABLE:
+        return KeywordAutomaton(keywords)
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+def dump_json_bytes(data) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def extractive_summary(abstract: str, max_chars: int = 300) -> str:
+    """First sentence of the abstract, stopping at the first sentence boundary"""
+    first = _SENTENCE_RE.split(abstract.strip(), maxsplit=1)[0]
+    return first[:max_chars] + '...' if len(first) > max_chars else first
+
+
+class RateLimiter:
+    """Keep requests from all threads at least `interval` seconds apart"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._last_request = 0.0
+    
+    def wait(self):
+        """Block until the calling thread may send its request"""
+        with self._lock:
+            delay = self._last_request + self.interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._last_request = time.monotonic()
+
+
+# Shared by all category fetches: they overlap result processing, while their
+# API requests still go out one per interval
+_ARXIV_RATE_LIMITER = RateLimiter(ARXIV_REQUEST_INTERVAL)
+
+
+def _onnx_dir_complete(path: Path) -> bool:
+    """Check whether an ONNX model directory was fully written"""
+    return (path / _ONNX_COMPLETE_MARKER).exists()
+
+
+def _fresh_build_dir(final_dir: Path) -> Path:
+    """Return an empty sibling directory to build final_dir in"""
+    build_dir = final_dir.with_name(final_dir.name + '.partial')
+    if build_dir.exists():
+        shutil.rmtree(build_dir)
+    build_dir.mkdir(parents=True)
+    return build_dir
+
+
+def _publish_build_dir(build_dir: Path, final_dir: Path) -> None:
+    """Mark a finished build complete and move it into place, replacing any stale copy"""
+    (build_dir / _ONNX_COMPLETE_MARKER).touch()
+    if final_dir.exists():
+        shutil.rmtree(final_dir)
+    os.replace(build_dir, final_dir)
+
+
 class ArxivBot:
     """Simple ArXiv Bot implementation"""
     
@@ -108,20 +237,68 @@ class ArxivBot:
         """Initialize the bot with configuration"""
         self.config = self._load_config(config_file)
         self._setup_logging()
+        self._kw_pattern = compile_keyword_pattern(self.config.get('arxiv', {}).get('keywords', []))
         self.summarizer = None
+        self.ort_model = None
+        self.tokenizer = None
+        
+        # SMTP connection reused across runs, closed at interpreter exit
+        self._smtp = None
+        atexit.register(self._close_smtp)
+        
         if AI_AVAILABLE:
             self._setup_summarizer()
         
         # Ensure data directory exists
         Path(self.config.get('data_dir', 'data')).mkdir(exist_ok=True)
         
+        # Papers already delivered in earlier runs, as {arxiv_id: published ISO timestamp}
+        self._seen_file = Path(self.config.get('data_dir', 'data')) / 'seen.json'
+        self._seen = self._load_seen()
+        
         print(f"🤖 ArXiv Bot initialized")
         print(f"📁 Data directory: {self.config.get('data_dir', 'data')}")
-        print(f"🧠 AI summarization: {'✓ Available' if self.summarizer else '✗ Disabled'}")
+        print(f"🧠 AI summarization: {'✓ Available' if self._ai_enabled() else '✗ Disabled'}")
         print(f"📧 Email: {'✓ Enabled' if self.config.get('email', {}).get('enabled') else '✗ Disabled'}")
         print(f"📱 Telegram: {'✓ Enabled' if self.config.get('telegram', {}).get('enabled') else '✗ Disabled'}")
         print(f"💬 Slack: {'✓ Enabled' if self.config.get('slack', {}).get('enabled') else '✗ Disabled'}")
     
+    def _load_seen(self) -> Dict[str, str]:
+        """Load the already-delivered ArXiv IDs with their publication times"""
+        try:
+            with open(self._seen_file, 'r') as f:
+                seen = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"⚠️  Could not read {self._seen_file}: {e}")
+            return {}
+        
+        # Older versions stored a plain list of IDs; date them now so they age out
+        if isinstance(seen, list):
+            now_iso = self._utc_now().isoformat()
+            seen = dict.fromkeys(seen, now_iso)
+        return seen
+    
+    def _save_seen(self):
+        """Persist the delivered ArXiv IDs, dropping those older than the retention window"""
+        days_back = self.config.get('arxiv', {}).get('days_lookback', 1)
+        retention = timedelta(days=max(SEEN_RETENTION_DAYS, days_back + 1))
+        # Timestamps are naive UTC ISO strings, which compare chronologically
+        cutoff = (self._utc_now() - retention).isoformat()
+        self._seen = {arxiv_id: published for arxiv_id, published in self._seen.items() if published >= cutoff}
+        
+        try:
+            with open(self._seen_file, 'w') as f:
+                json.dump(self._seen, f)
+        except Exception as e:
+            print(f"❌ Error saving {self._seen_file}: {e}")
+    
+    @staticmethod
+    def _utc_now() -> datetime:
+        """Current UTC time as a naive datetime, matching Paper.published"""
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+    
     def _load_config(self, config_file: str) -> Dict:
         """Load configuration from YAML file or environment variables"""
         config = {}
@@ -185,6 +362,12 @@ class ArxivBot:
             config['slack']['enabled'] = True
             config['slack']['webhook_url'] = os.getenv('SLACK_WEBHOOK_URL')
         
+        # Summarizer settings
+        if os.getenv('SUMMARIZER_PRECISION'):
+            if 'summarizer' not in config:
+                config['summarizer'] = {}
+            config['summarizer']['precision'] = os.getenv('SUMMARIZER_PRECISION').strip().lower()
+        
         return config
     
     def _get_default_config(self) -> Dict:
@@ -224,12 +407,25 @@ class ArxivBot:
     def _setup_summarizer(self):
         """Setup AI summarizer"""
         try:
-            model_name = self.config.get('summarizer', {}).get('model_name', 'facebook/bart-large-cnn')
+            from transformers import pipeline
+            
+            model_name = self.config.get('summarizer', {}).get('model_name', 'sshleifer/distilbart-cnn-12-6')
+            precision = self.config.get('summarizer', {}).get('precision', 'fp32')
             print(f"🧠 Loading AI model: {model_name}")
             
-            # Use a lightweight model for better compatibility
-            model_name = "facebook/bart-large-cnn"
-            self.summarizer = pipeline("summarization", model=model_name, device=-1)  # Use CPU
+            # ONNX Runtime has no useful BF16 CPU kernels, so bf16 always uses PyTorch
+            if ONNX_AVAILABLE and precision != 'bf16':
+                try:
+                    self._setup_onnx_summarizer(model_name)
+                    print(f"✅ AI model loaded successfully (ONNX Runtime)")
+                    return
+                except Exception as e:
+                    print(f"⚠️  ONNX Runtime setup failed, falling back to PyTorch: {e}")
+                    self.ort_model = None
+                    self.tokenizer = None
+            
+            self.summarizer = self._load_torch_pipeline(pipeline, model_name, precision)
+            self._optimize_torch_model()
             print(f"✅ AI model loaded successfully")
             
         except Exception as e:
@@ -237,6 +433,158 @@ class ArxivBot:
             print("📝 Will create simple extractive summaries instead")
             self.summarizer = None
     
+    def _setup_onnx_summarizer(self, model_name: str):
+        """Export the model to ONNX once and load it into an ONNX Runtime session"""
+        import onnxruntime as ort
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        from transformers import AutoTokenizer
+        
+        onnx_dir = Path(self.config.get('data_dir', 'data')) / 'onnx' / model_name.replace('/', '__')
+        precision = self.config.get('summarizer', {}).get('precision', 'fp32')
+        
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.intra_op_num_threads = os.cpu_count() or 1
+        
+        # Build in a scratch directory so an interrupted export is never mistaken for a cache
+        if not _onnx_dir_complete(onnx_dir):
+            print(f"📦 Exporting {model_name} to ONNX (one-time)...")
+            build_dir = _fresh_build_dir(onnx_dir)
+            exported = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+            exported.save_pretrained(build_dir)
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(build_dir)
+            _publish_build_dir(build_dir, onnx_dir)
+        
+        # FP16 kernels are only worthwhile on GPU; CPUs fall back to INT8
+        provider = "CPUExecutionProvider"
+        if precision == 'fp16':
+            if "CUDAExecutionProvider" in ort.get_available_providers():
+                provider = "CUDAExecutionProvider"
+            else:
+                print("⚠️  FP16 needs a CUDA device, using INT8 quantization instead")
+                precision = 'int8'
+        
+        model_dir = onnx_dir
+        if precision in ('fp16', 'int8'):
+            model_dir = self._reduce_onnx_precision(onnx_dir, precision)
+        
+        self.ort_model = ORTModelForSeq2SeqLM.from_pretrained(
+            model_dir, session_options=session_options, provider=provider
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+        print(f"🧮 Summarizer precision: {precision}")
+    
+    def _reduce_onnx_precision(self, onnx_dir: Path, precision: str) -> Path:
+        """Convert the exported ONNX graphs to FP16 or dynamic INT8 (cached on disk)"""
+        from optimum.onnxruntime import ORTOptimizer, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig, OptimizationConfig
+        
+        target_dir = onnx_dir / precision
+        if _onnx_dir_complete(target_dir):
+            return target_dir
+        
+        print(f"📦 Converting ONNX model to {precision} (one-time)...")
+        build_dir = _fresh_build_dir(target_dir)
+        
+        if precision == 'fp16':
+            optimizer = ORTOptimizer.from_pretrained(onnx_dir)
+            optimizer.optimize(
+                save_dir=build_dir,
+                optimization_config=OptimizationConfig(
+                    optimization_level=99, fp16=True, optimize_for_gpu=True
+                ),
+                file_suffix=""
+            )
+        else:
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            for onnx_file in onnx_dir.glob('*.onnx'):
+                quantizer = ORTQuantizer.from_pretrained(onnx_dir, file_name=onnx_file.name)
+                quantizer.quantize(save_dir=build_dir, quantization_config=qconfig, file_suffix="")
+        
+        if not (build_dir / 'config.json').exists():
+            shutil.copy(onnx_dir / 'config.json', build_dir / 'config.json')
+        
+        _publish_build_dir(build_dir, target_dir)
+        return target_dir
+    
+    def _load_torch_pipeline(self, pipeline, model_name: str, precision: str):
+        """Build the PyTorch summarization pipeline in the requested precision"""
+        import torch
+        
+        if precision == 'bf16':
+            # BF16 halves weight memory; CPUs with AVX512-BF16/AMX also run it faster
+            summarizer = pipeline("summarization", model=model_name, device=-1, torch_dtype=torch.bfloat16)
+            print("🧮 Summarizer precision: bf16")
+            return summarizer
+        
+        summarizer = pipeline("summarization", model=model_name, device=-1)  # Use CPU
+        if precision == 'int8':
+            # Dynamic INT8 quantization of the Linear layers; no calibration needed
+            summarizer.model = torch.ao.quantization.quantize_dynamic(
+                summarizer.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            print("🧮 Summarizer precision: int8")
+        return summarizer
+    
+    def _optimize_torch_model(self):
+        """Speed up the PyTorch pipeline with fused attention and, optionally, torch.compile"""
+        import torch
+        
+        try:
+            from optimum.bettertransformer import BetterTransformer
+            self.summarizer.model = BetterTransformer.transform(self.summarizer.model)
+            print("⚡ BetterTransformer fused attention enabled")
+        except Exception as e:
+            print(f"ℹ️  BetterTransformer not applied: {e}")
+        
+        # torch.compile errors only surface on the first call, so keep it opt-in
+        if not self.config.get('summarizer', {}).get('torch_compile', False):
+            return
+        if int(torch.__version__.split('.')[0]) < 2:
+            print("ℹ️  torch.compile needs PyTorch 2.0 or newer")
+            return
+        try:
+            self.summarizer.model = torch.compile(
+                self.summarizer.model, mode='reduce-overhead', fullgraph=False
+            )
+            print("⚡ torch.compile enabled")
+        except Exception as e:
+            print(f"ℹ️  torch.compile not applied: {e}")
+    
+    def _ai_enabled(self) -> bool:
+        """Check whether an AI summarization backend is loaded"""
+        return self.ort_model is not None or self.summarizer is not None
+    
+    def _generate_summaries(self, input_texts: List[str], max_length: int, min_length: int) -> List[str]:
+        """Generate summaries for a batch of inputs with whichever backend is loaded"""
+        if self.ort_model is not None:
+            inputs = self.tokenizer(
+                input_texts,
+                padding=True,
+                truncation=True,
+                max_length=1024,
+                return_tensors="pt"
+            )
+            # Beam settings come from the model's generation_config, as in the
+            # PyTorch pipeline, so both backends produce the same summaries
+            output_ids = self.ort_model.generate(
+                **inputs,
+                max_length=max_length,
+                min_length=min_length,
+                do_sample=False
+            )
+            return self.tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+        
+        summary_results = self.summarizer(
+            input_texts,
+            max_length=max_length,
+            min_length=min_length,
+            do_sample=False,
+            truncation=True,
+            batch_size=len(input_texts)
+        )
+        return [result['summary_text'] for result in summary_results]
+    
     def fetch_papers(self) -> List[Paper]:
         """Fetch papers from ArXiv"""
         try:
@@ -250,57 +598,32 @@ class ArxivBot:
             print(f"🔑 Keywords: {keywords}")
             print(f"📅 Days back: {days_back}")
             
-            all_papers = []
+            import arxiv
             
-            for category in categories:
-                try:
-                    print(f"📖 Searching category: {category}")
-                    
-                    # Create search
-                    search = arxiv.Search(
-                        query=f"cat:{category}",
-                        max_results=max_papers,
-                        sort_by=arxiv.SortCriterion.SubmittedDate,
-                        sort_order=arxiv.SortOrder.Descending
-                    )
-                    
-                    category_papers = []
-                    for result in search.results():
-                        try:
-                            # Check if paper is recent enough
-                            days_old = (datetime.now() - result.published.replace(tzinfo=None)).days
-                            if days_old <= days_back:
-                                paper = Paper(
-                                    title=result.title,
-                                    authors=[str(author) for author in result.authors],
-                                    abstract=result.summary,
-                                    categories=result.categories,
-                                    published=result.published.replace(tzinfo=None),
-                                    arxiv_id=result.get_short_id(),
-                                    pdf_url=result.pdf_url,
-                                    entry_id=result.entry_id
-                                )
-                                
-                                # Filter by keywords
-                                if paper.matches_keywords(keywords):
-                                    category_papers.append(paper)
-                                    
-                        except Exception as e:
-                            self.logger.warning(f"Error processing paper: {e}")
-                            continue
-                    
-                    all_papers.extend(category_papers)
-                    print(f"✅ Found {len(category_papers)} relevant papers in {category}")
-                    
-                except Exception as e:
-                    print(f"❌ Error searching category {category}: {e}")
-                    continue
+            # One shared client so all categories go through the same connection pool;
+            # a page covers max_papers, so each category is a single (spaced) request
+            client = arxiv.Client(
+                page_size=max(100, max_papers), delay_seconds=ARXIV_REQUEST_INTERVAL, num_retries=3
+            )
+            
+            # Let the arXiv API do the date filtering (submittedDate is in UTC).
+            # The window is computed once per fetch, not per result.
+            until = datetime.now(timezone.utc)
+            since = until - timedelta(days=days_back)
+            date_range = f"[{since.strftime('%Y%m%d%H%M')} TO {until.strftime('%Y%m%d%H%M')}]"
+            
+            # Papers are deduplicated as they arrive; the lock guards the shared dict
+            unique_papers: Dict[str, Paper] = {}
+            lock = threading.Lock()
             
-            # Remove duplicates and limit
-            unique_papers = {}
-            for paper in all_papers:
-                if paper.arxiv_id not in unique_papers:
-                    unique_papers[paper.arxiv_id] = paper
+            # Categories are independent network round-trips, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(categories)))) as executor:
+                list(executor.map(
+                    lambda category: self._fetch_category(
+                        client, category, max_papers, date_range, unique_papers, lock
+                    ),
+                    categories
+                ))
             
             papers_list = list(unique_papers.values())[:max_papers]
             print(f"📋 Final result: {len(papers_list)} unique papers")
@@ -311,47 +634,155 @@ class ArxivBot:
             print(f"❌ Error fetching papers: {e}")
             return []
     
+    def _fetch_category(
+        self,
+        client: "arxiv.Client",
+        category: str,
+        max_papers: int,
+        date_range: str,
+        unique_papers: Dict[str, Paper],
+        lock: threading.Lock
+    ) -> int:
+        """Fetch relevant papers for a single category into unique_papers, returning how many were added"""
+        import arxiv
+        
+        try:
+            print(f"📖 Searching category: {category}")
+            
+            # Create search
+            search = arxiv.Search(
+                query=f"cat:{category} AND submittedDate:{date_range}",
+                max_results=max_papers,
+                sort_by=arxiv.SortCriterion.SubmittedDate,
+                sort_order=arxiv.SortOrder.Descending
+            )
+            
+            _ARXIV_RATE_LIMITER.wait()
+            added = 0
+            for result in client.results(search):
+                try:
+                    # Papers from earlier runs need neither keyword matching nor summarizing
+                    if result.get_short_id() in self._seen:
+                        continue
+                    
+                    paper = Paper(
+                        title=result.title,
+                        authors=[str(author) for author in result.authors],
+                        abstract=result.summary,
+                        categories=result.categories,
+                        published=result.published.replace(tzinfo=None),
+                        arxiv_id=result.get_short_id(),
+                        pdf_url=result.pdf_url,
+                        entry_id=result.entry_id
+                    )
+                    
+                    # Filter by keywords
+                    if paper.matches_keywords(self._kw_pattern):
+                        with lock:
+                            if paper.arxiv_id not in unique_papers:
+                                unique_papers[paper.arxiv_id] = paper
+                                added += 1
+                            limit_reached = len(unique_papers) >= max_papers
+                        
+                        # Stop paging once enough papers have been collected overall
+                        if limit_reached:
+                            break
+                        
+                except Exception as e:
+                    self.logger.warning(f"Error processing paper: {e}")
+                    continue
+            
+            print(f"✅ Found {added} relevant papers in {category}")
+            return added
+            
+        except Exception as e:
+            print(f"❌ Error searching category {category}: {e}")
+            return 0
+    
     def summarize_papers(self, papers: List[Paper]) -> List[Paper]:
         """Add AI summaries to papers"""
-        if not self.summarizer:
+        if not self._ai_enabled():
             print("📝 Using simple extractive summaries")
             for paper in papers:
                 # Simple extractive summary - first sentence of abstract
-                sentences = paper.abstract.split('.')
-                paper.summary = sentences[0].strip() + '.' if sentences else paper.abstract[:100] + '...'
+                paper.summary = extractive_summary(paper.abstract)
             return papers
         
         print(f"🧠 Generating AI summaries for {len(papers)} papers...")
         
-        for i, paper in enumerate(papers):
+        max_length = self.config.get('summarizer', {}).get('max_summary_length', 150)
+        min_length = self.config.get('summarizer', {}).get('min_summary_length', 50)
+        batch_size = self.config.get('summarizer', {}).get('batch_size', 8)
+        
+        # Abstracts that already fit in a summary skip the model pass and get the
+        # same lead-sentence summary as the non-AI path, so Slack and Telegram
+        # (which show little or none of the abstract) still have a description
+        to_summarize = []
+        for paper in papers:
+            if len(paper.abstract.split()) <= max_length:
+                paper.summary = extractive_summary(paper.abstract)
+            else:
+                to_summarize.append(paper)
+        
+        if len(to_summarize) < len(papers):
+            print(f"📝 {len(papers) - len(to_summarize)} abstracts are short enough to skip the model")
+        
+        for start in range(0, len(to_summarize), batch_size):
+            batch = to_summarize[start:start + batch_size]
             try:
-                print(f"📝 Summarizing paper {i+1}/{len(papers)}: {paper.title[:50]}...")
+                print(f"📝 Summarizing papers {start+1}-{start+len(batch)}/{len(to_summarize)}...")
                 
                 # Prepare input text
-                input_text = f"Title: {paper.title}\n\nAbstract: {paper.abstract}"
-                
-                # Generate summary
-                max_length = self.config.get('summarizer', {}).get('max_summary_length', 150)
-                min_length = self.config.get('summarizer', {}).get('min_summary_length', 50)
+                input_texts = [f"Title: {paper.title}\n\nAbstract: {paper.abstract}" for paper in batch]
                 
-                summary_result = self.summarizer(
-                    input_text,
-                    max_length=max_length,
-                    min_length=min_length,
-                    do_sample=False
-                )
+                # Generate summaries for the whole batch in one call
+                summaries = self._generate_summaries(input_texts, max_length, min_length)
                 
-                paper.summary = summary_result[0]['summary_text']
+                for paper, summary in zip(batch, summaries):
+                    paper.summary = summary
                 
             except Exception as e:
-                print(f"❌ Error summarizing paper {paper.arxiv_id}: {e}")
+                print(f"❌ Error summarizing batch starting at {batch[0].arxiv_id}: {e}")
                 # Fallback to simple summary
-                sentences = paper.abstract.split('.')
-                paper.summary = sentences[0].strip() + '.' if sentences else paper.abstract[:100] + '...'
+                for paper in batch:
+                    paper.summary = extractive_summary(paper.abstract)
         
         print("✅ Summarization complete")
         return papers
     
+    def _get_smtp(self, email_config: Dict) -> smtplib.SMTP:
+        """Return a logged-in SMTP connection, reusing the cached one while it is alive"""
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._smtp = None
+        
+        server_name = email_config.get('smtp_server', 'smtp.gmail.com')
+        port = email_config.get('smtp_port', 587)
+        
+        # Port 465 speaks TLS from the start, which skips the STARTTLS round-trip
+        if port == 465:
+            server = smtplib.SMTP_SSL(server_name, port)
+        else:
+            server = smtplib.SMTP(server_name, port)
+            server.starttls()
+        server.login(email_config['sender_email'], email_config['sender_password'])
+        
+        self._smtp = server
+        return server
+    
+    def _close_smtp(self):
+        """Close the cached SMTP connection, if any"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            pass
+        self._smtp = None
+    
     def send_email(self, papers: List[Paper]) -> bool:
         """Send email digest"""
         email_config = self.config.get('email', {})
@@ -360,25 +791,26 @@ class ArxivBot:
         
         try:
             print("📧 Sending email digest...")
+            now = datetime.now()
             
             # Create message
             msg = MIMEMultipart()
             msg['From'] = email_config['sender_email']
             msg['To'] = email_config.get('recipient_email', email_config['sender_email'])
-            msg['Subject'] = f"[ArXiv Digest] {len(papers)} New Papers - {datetime.now().strftime('%Y-%m-%d')}"
+            msg['Subject'] = f"[ArXiv Digest] {len(papers)} New Papers - {now.strftime('%Y-%m-%d')}"
             
             # Create HTML content
-            html_content = f"""
+            html_parts = [f"""
             <html>
             <body>
             <h2>🔬 ArXiv Research Digest</h2>
-            <p><strong>Date:</strong> {datetime.now().strftime('%B %d, %Y')}</p>
+            <p><strong>Date:</strong> {now.strftime('%B %d, %Y')}</p>
             <p><strong>Papers Found:</strong> {len(papers)}</p>
             <hr>
-            """
+            """]
             
             for i, paper in enumerate(papers, 1):
-                html_content += f"""
+                html_parts.append(f"""
                 <div style="margin-bottom: 30px; padding: 15px; border-left: 4px solid #2196F3; background-color: #f9f9f9;">
                 <h3 style="color: #1976D2;">{i}. {paper.title}</h3>
                 <p><strong>Authors:</strong> {', '.join(paper.authors[:3])}{'...' if len(paper.authors) > 3 else ''}</p>
@@ -392,28 +824,27 @@ class ArxivBot:
                 <a href="{paper.entry_id}" style="color: #2196F3;">🔗 ArXiv Page</a>
                 </p>
                 </div>
-                """
+                """)
             
-            html_content += """
+            html_parts.append("""
             <hr>
             <p><small>Generated by ArXiv Bot</small></p>
             </body>
             </html>
-            """
+            """)
+            html_content = ''.join(html_parts)
             
             msg.attach(MIMEText(html_content, 'html'))
             
-            # Send email
-            server = smtplib.SMTP(email_config.get('smtp_server', 'smtp.gmail.com'), email_config.get('smtp_port', 587))
-            server.starttls()
-            server.login(email_config['sender_email'], email_config['sender_password'])
-            server.send_message(msg)
-            server.quit()
+            # Send email over the cached connection
+            self._get_smtp(email_config).send_message(msg)
             
             print("✅ Email sent successfully")
             return True
             
         except Exception as e:
+            # Drop the connection so the next send starts from a clean session
+            self._close_smtp()
             print(f"❌ Error sending email: {e}")
             return False
     
@@ -429,16 +860,25 @@ class ArxivBot:
         try:
             print("📱 Sending Telegram message...")
             
-            bot = Bot(token=telegram_config['bot_token'])
-            chat_id = telegram_config['chat_id']
+            asyncio.run(self._send_telegram_async(papers, telegram_config))
             
-            # Send header
-            header_msg = f"🔬 *ArXiv Research Digest*\n\n📅 {datetime.now().strftime('%B %d, %Y')}\n📊 {len(papers)} New Papers"
-            bot.send_message(chat_id=chat_id, text=header_msg, parse_mode='Markdown')
+            print("✅ Telegram message sent successfully")
+            return True
             
-            # Send papers (in batches to avoid message length limits)
-            for i, paper in enumerate(papers[:5]):  # Limit to 5 papers for Telegram
-                message = f"""
+        except Exception as e:
+            print(f"❌ Error sending Telegram message: {e}")
+            return False
+    
+    async def _send_telegram_async(self, papers: List[Paper], telegram_config: Dict):
+        """Send the Telegram header, then the paper messages in order over one bot session"""
+        from telegram import Bot
+        
+        chat_id = telegram_config['chat_id']
+        
+        # Build paper messages (in batches to avoid message length limits)
+        messages = []
+        for i, paper in enumerate(papers[:5]):  # Limit to 5 papers for Telegram
+            messages.append(f"""
 *{i+1}. {paper.title[:80]}{'...' if len(paper.title) > 80 else ''}*
 
 👥 *Authors:* {', '.join(paper.authors[:2])}{'...' if len(paper.authors) > 2 else ''}
@@ -449,17 +889,35 @@ class ArxivBot:
 📄 *Abstract:* {paper.abstract[:200]}{'...' if len(paper.abstract) > 200 else ''}
 
 🔗 [ArXiv Page]({paper.entry_id}) | [PDF]({paper.pdf_url})
-"""
-                
-                bot.send_message(chat_id=chat_id, text=message, parse_mode='Markdown', disable_web_page_preview=True)
-                time.sleep(1)  # Rate limiting
-            
-            print("✅ Telegram message sent successfully")
-            return True
+""")
+        
+        async with Bot(token=telegram_config['bot_token']) as bot:
+            # Send header
+            header_msg = f"🔬 *ArXiv Research Digest*\n\n📅 {datetime.now().strftime('%B %d, %Y')}\n📊 {len(papers)} New Papers"
+            await self._send_telegram_message(bot, chat_id, header_msg)
             
-        except Exception as e:
-            print(f"❌ Error sending Telegram message: {e}")
-            return False
+            # One message at a time keeps the papers in order and within the
+            # per-chat rate limit
+            for message in messages:
+                await asyncio.sleep(TELEGRAM_MESSAGE_INTERVAL)
+                await self._send_telegram_message(bot, chat_id, message, disable_web_page_preview=True)
+    
+    async def _send_telegram_message(self, bot, chat_id, text: str, **kwargs):
+        """Send one Markdown message, waiting out Telegram flood control (RetryAfter) between attempts"""
+        from telegram.error import RetryAfter
+        
+        for attempt in range(1, TELEGRAM_SEND_ATTEMPTS + 1):
+            try:
+                return await bot.send_message(chat_id=chat_id, text=text, parse_mode='Markdown', **kwargs)
+            except RetryAfter as e:
+                if attempt == TELEGRAM_SEND_ATTEMPTS:
+                    raise
+                # retry_after is seconds, or a timedelta in newer python-telegram-bot versions
+                retry_after = e.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                print(f"⏳ Telegram rate limit hit, retrying in {retry_after:.0f}s")
+                await asyncio.sleep(retry_after)
     
     def send_slack(self, papers: List[Paper]) -> bool:
         """Send Slack message"""
@@ -473,22 +931,24 @@ class ArxivBot:
         try:
             print("💬 Sending Slack message...")
             
+            from slack_sdk.webhook import WebhookClient
+            
             webhook = WebhookClient(slack_config['webhook_url'])
             
             # Create message
-            message = f"🔬 *ArXiv Research Digest*\n\n📅 {datetime.now().strftime('%B %d, %Y')}\n📊 {len(papers)} New Papers\n\n"
+            message_parts = [f"🔬 *ArXiv Research Digest*\n\n📅 {datetime.now().strftime('%B %d, %Y')}\n📊 {len(papers)} New Papers\n\n"]
             
             for i, paper in enumerate(papers[:3]):  # Limit to 3 papers for Slack
-                message += f"*{i+1}. {paper.title[:100]}{'...' if len(paper.title) > 100 else ''}*\n"
-                message += f"👥 Authors: {', '.join(paper.authors[:2])}{'...' if len(paper.authors) > 2 else ''}\n"
-                message += f"🏷️ Categories: {', '.join(paper.categories[:2])}\n"
+                message_parts.append(f"*{i+1}. {paper.title[:100]}{'...' if len(paper.title) > 100 else ''}*\n")
+                message_parts.append(f"👥 Authors: {', '.join(paper.authors[:2])}{'...' if len(paper.authors) > 2 else ''}\n")
+                message_parts.append(f"🏷️ Categories: {', '.join(paper.categories[:2])}\n")
                 
                 if paper.summary:
-                    message += f"🤖 Summary: {paper.summary[:150]}{'...' if len(paper.summary) > 150 else ''}\n"
+                    message_parts.append(f"🤖 Summary: {paper.summary[:150]}{'...' if len(paper.summary) > 150 else ''}\n")
                 
-                message += f"🔗 <{paper.entry_id}|ArXiv Page> | <{paper.pdf_url}|PDF>\n\n"
+                message_parts.append(f"🔗 <{paper.entry_id}|ArXiv Page> | <{paper.pdf_url}|PDF>\n\n")
             
-            webhook.send(text=message)
+            webhook.send(text=''.join(message_parts))
             
             print("✅ Slack message sent successfully")
             return True
@@ -503,15 +963,26 @@ class ArxivBot:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             data_dir = Path(self.config.get('data_dir', 'data'))
             
-            results = {
-                'timestamp': timestamp,
-                'papers': [paper.to_dict() for paper in papers],
-                'config': self.config
-            }
+            # Stream the digest envelope and one paper at a time instead of
+            # materializing the whole document in memory first
+            if self.config.get('compress_digests', False):
+                filename = data_dir / f"digest_{timestamp}.json.gz"
+                f = gzip.open(filename, 'wb')
+            else:
+                filename = data_dir / f"digest_{timestamp}.json"
+                f = open(filename, 'wb')
             
-            filename = data_dir / f"digest_{timestamp}.json"
-            with open(filename, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            with f:
+                f.write(b'{"timestamp": ')
+                f.write(dump_json_bytes(timestamp))
+                f.write(b', "papers": [')
+                for i, paper in enumerate(papers):
+                    if i:
+                        f.write(b', ')
+                    f.write(dump_json_bytes(paper.to_dict()))
+                f.write(b'], "config": ')
+                f.write(dump_json_bytes(self.config))
+                f.write(b'}')
             
             print(f"💾 Results saved to {filename}")
             
@@ -545,6 +1016,12 @@ class ArxivBot:
         if self.send_slack(papers):
             notifications_sent += 1
         
+        # Remember delivered papers so later runs skip them; if every channel
+        # failed (or none is enabled) the papers are offered again next run
+        if notifications_sent:
+            self._seen.update((paper.arxiv_id, paper.published.isoformat()) for paper in papers)
+            self._save_seen()
+        
         print(f"\n✅ Bot run complete!")
         print(f"📊 Papers processed: {len(papers)}")
         print(f"📤 Notifications sent: {notifications_sent}")
@@ -587,14 +1064,76 @@ class ArxivBot:
             schedule.every().monday.at("09:00").do(self.run_once)
             print("📅 Scheduled weekly runs on Mondays at 9:00 AM")
         
+        # Trigger socket so cron/manual runs reuse this process and its loaded model
+        socket_path = Path(self.config.get('data_dir', 'data')) / 'bot.sock'
+        trigger_socket = self._open_trigger_socket(socket_path)
+        
         print("🔄 Scheduler started. Press Ctrl+C to stop.")
         
         try:
             while True:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                if trigger_socket is None:
+                    time.sleep(60)  # Check every minute
+                    continue
+                
+                # Wait up to a minute for a trigger instead of sleeping blindly
+                readable, _, _ = select.select([trigger_socket], [], [], 60)
+                if readable:
+                    self._handle_trigger(trigger_socket)
         except KeyboardInterrupt:
             print("\n👋 Scheduler stopped")
+        finally:
+            if trigger_socket is not None:
+                trigger_socket.close()
+                socket_path.unlink(missing_ok=True)
+    
+    def _open_trigger_socket(self, socket_path: Path) -> Optional[socket.socket]:
+        """Listen on a Unix socket for 'run' requests (None where unsupported)"""
+        if not hasattr(socket, 'AF_UNIX'):
+            return None
+        
+        try:
+            socket_path.unlink(missing_ok=True)  # Stale socket from an earlier process
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(str(socket_path))
+            server.listen(1)
+            print(f"🔌 Listening for run triggers on {socket_path}")
+            return server
+        except OSError as e:
+            print(f"⚠️  Could not open trigger socket {socket_path}: {e}")
+            return None
+    
+    def _handle_trigger(self, trigger_socket: socket.socket):
+        """Accept one trigger connection and run the digest if asked to"""
+        conn, _ = trigger_socket.accept()
+        with conn:
+            command = conn.recv(64).decode('utf-8', errors='ignore').strip().lower()
+            if command == 'run':
+                conn.sendall(b'ok\n')
+                self.run_once()
+            else:
+                conn.sendall(b'unknown command\n')
+
+
+def trigger_running_bot(config_file: str) -> bool:
+    """Ask a running scheduler process to run the digest now (no model loading here)"""
+    data_dir = 'data'
+    if os.path.exists(config_file):
+        with open(config_file, 'r') as f:
+            data_dir = (yaml.safe_load(f) or {}).get('data_dir', 'data')
+    socket_path = Path(data_dir) / 'bot.sock'
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+            client.sendall(b'run\n')
+            reply = client.recv(64).decode('utf-8', errors='ignore').strip()
+        print(f"📨 Trigger sent to {socket_path}: {reply}")
+        return reply == 'ok'
+    except (OSError, AttributeError) as e:
+        print(f"❌ No running scheduler at {socket_path}: {e}")
+        return False
 
 
 def main():
@@ -606,9 +1145,13 @@ def main():
     parser.add_argument("--run-once", action="store_true", help="Run once and exit")
     parser.add_argument("--test", action="store_true", help="Test notification systems")
     parser.add_argument("--schedule", action="store_true", help="Start scheduler")
+    parser.add_argument("--trigger", action="store_true", help="Ask a running scheduler to run now")
     
     args = parser.parse_args()
     
+    if args.trigger:
+        sys.exit(0 if trigger_running_bot(args.config) else 1)
+    
     try:
         bot = ArxivBot(config_file=args.config)
         
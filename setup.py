@@ -11,19 +11,32 @@ For licensing inquiries, contact: sreeram.lagisetty@gmail.com
 """
 
 import os
+import hashlib
+import shlex
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Wheel cache kept next to the project so repeated setups skip downloads
+PIP_CACHE_DIR = ".pip-cache"
+
+# Digest of the requirements last installed into the venv
+REQUIREMENTS_HASH_FILE = Path("arxiv_bot") / ".req_hash"
+
 
 def run_command(command, description=""):
-    """Run a shell command and handle errors"""
+    """Run a command (argument list or command string) and handle errors"""
+    # Run the program directly rather than through an intermediate /bin/sh
+    args = shlex.split(command) if isinstance(command, str) else list(command)
+    
     print(f"{'='*50}")
-    print(f"Running: {description or command}")
+    print(f"Running: {description or ' '.join(args)}")
     print(f"{'='*50}")
     
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(args, shell=False, check=True, capture_output=True, text=True)
         print(result.stdout)
         if result.stderr:
             print("Warnings:", result.stderr)
@@ -33,6 +46,9 @@ def run_command(command, description=""):
         print(f"stdout: {e.stdout}")
         print(f"stderr: {e.stderr}")
         return False
+    except OSError as e:
+        print(f"Error: could not run {args[0]}: {e}")
+        return False
 
 
 def check_python_version():
@@ -50,32 +66,66 @@ def setup_virtual_environment():
     """Set up virtual environment"""
     venv_path = Path("arxiv_bot")
     
-    if venv_path.exists():
+    # pyvenv.cfg marks a real environment rather than a leftover or empty directory
+    if (venv_path / "pyvenv.cfg").is_file():
         print("Virtual environment already exists ✓")
         return True
     
+    # A hash left in a half-deleted environment would make install_dependencies
+    # skip installing into the fresh one
+    REQUIREMENTS_HASH_FILE.unlink(missing_ok=True)
+    
     print("Creating virtual environment...")
-    return run_command("python3 -m venv arxiv_bot", "Creating virtual environment")
+    return run_command([sys.executable, "-m", "venv", "arxiv_bot"], "Creating virtual environment")
 
 
 def install_dependencies():
     """Install Python dependencies"""
+    requirements_hash = hashlib.sha256(Path("requirements.txt").read_bytes()).hexdigest()
+    
+    # Skip the install entirely when requirements.txt is unchanged since the last run
+    try:
+        if REQUIREMENTS_HASH_FILE.read_text().strip() == requirements_hash:
+            print("Dependencies up to date ✓")
+            return True
+    except OSError:
+        pass
+    
     print("Installing dependencies...")
     
-    # Determine the correct pip path
+    # Determine the correct pip and python paths
     if os.name == 'nt':  # Windows
         pip_path = "arxiv_bot\\Scripts\\pip"
+        venv_python = "arxiv_bot\\Scripts\\python"
     else:  # Unix-like
         pip_path = "arxiv_bot/bin/pip"
+        venv_python = "arxiv_bot/bin/python"
+    
+    # uv resolves and downloads in parallel; use it when it is on PATH
+    uv_path = shutil.which("uv")
+    if uv_path:
+        if not run_command(
+            [uv_path, "pip", "install", "--python", venv_python, "-r", "requirements.txt"],
+            "Installing dependencies with uv"
+        ):
+            return False
+        
+        REQUIREMENTS_HASH_FILE.write_text(requirements_hash)
+        print("Dependencies installed successfully ✓")
+        return True
     
     # Upgrade pip first
-    if not run_command(f"{pip_path} install --upgrade pip", "Upgrading pip"):
+    if not run_command([pip_path, "install", "--upgrade", "pip"], "Upgrading pip"):
         return False
     
-    # Install dependencies
-    if not run_command(f"{pip_path} install -r requirements.txt", "Installing dependencies"):
+    # Install dependencies, preferring wheels and reusing a local wheel cache on re-runs
+    if not run_command(
+        [pip_path, "install", "--prefer-binary", "--cache-dir", PIP_CACHE_DIR, "-r", "requirements.txt"],
+        "Installing dependencies"
+    ):
         return False
     
+    REQUIREMENTS_HASH_FILE.write_text(requirements_hash)
     print("Dependencies installed successfully ✓")
     return True
 
@@ -95,10 +145,11 @@ def create_config_file():
 
 def create_directories():
     """Create necessary directories"""
-    directories = ["data", "data/papers", "data/summaries", "data/pdfs", "data/logs"]
+    # Leaf directories only; "data" itself is created along the way
+    directories = ["data/papers", "data/summaries", "data/pdfs", "data/logs"]
     
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        os.makedirs(directory, exist_ok=True)
     
     print("Data directories created ✓")
     return True
@@ -147,24 +198,32 @@ def main():
     if not check_python_version():
         sys.exit(1)
     
-    # Setup virtual environment
-    if not setup_virtual_environment():
+    # Setup virtual environment in the background; the scaffolding below
+    # never touches arxiv_bot/, so both can proceed at once
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        venv_future = executor.submit(setup_virtual_environment)
+        
+        # Create configuration
+        create_config_file()
+        
+        # Create directories
+        directories_created = create_directories()
+        
+        venv_created = venv_future.result()
+    
+    if not venv_created:
         print("Failed to create virtual environment")
         sys.exit(1)
     
+    if not directories_created:
+        print("Failed to create directories")
+        sys.exit(1)
+    
     # Install dependencies
     if not install_dependencies():
         print("Failed to install dependencies")
         sys.exit(1)
     
-    # Create configuration
-    create_config_file()
-    
-    # Create directories
-    if not create_directories():
-        print("Failed to create directories")
-        sys.exit(1)
-    
     # Show next steps
     show_next_steps()
 
@@ -9,18 +9,126 @@ GitHub: https://github.com/Sreeram5678
 For licensing inquiries, contact: sreeram.lagisetty@gmail.com
 """
 
-import arxiv
-import requests
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
 import re
+import copy
+import io
+import time
+import pickle
+import hashlib
+import tempfile
+import heapq
+import asyncio
 import logging
+import threading
+import importlib.util
+import xml.etree.ElementTree as ET
+import sys
 from pathlib import Path
 
+from src.utils.helpers import MSGSPEC_AVAILABLE, save_msgpack, load_msgpack
 
-@dataclass
-class Paper:
+# Optional async HTTP client for querying the ArXiv API directly.
+# Only probed here; it is imported when a search actually runs.
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
+
+# The arxiv library (and feedparser behind it) is imported on first search
+_arxiv = None
+
+
+def _get_arxiv():
+    """Import the arxiv library on first use and reuse the module afterwards"""
+    global _arxiv
+    if _arxiv is None:
+        import arxiv
+        _arxiv = arxiv
+    return _arxiv
+
+
+# Text cleanup pattern, compiled once for all papers: inline math ($...$)
+# or a LaTeX command with one braced argument (\cmd{...})
+_MARKUP_RE = re.compile(r'\$[^$]*\$|\\[a-zA-Z]+\{[^}]*\}')
+
+# Category search results are cached in memory and on disk (shared across
+# restarts); both layers use the same TTL, counted from when the search ran
+_SEARCH_CACHE_TTL = 1800  # seconds
+_SEARCH_CACHE_MAX_ENTRIES = 64
+
+# ArXiv API endpoint and Atom feed tags used by the direct (httpx) search path
+_ARXIV_API_URL = "https://export.arxiv.org/api/query"
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_ATOM_ENTRY = f"{_ATOM_NS}entry"
+
+# Concurrent category queries per search; ArXiv asks clients to keep request rates low
+_MAX_CONCURRENT_QUERIES = 4
+
+# ArXiv API policy: at most one request every 3 seconds
+_ARXIV_REQUEST_INTERVAL = 3.0
+
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class _RateLimiter:
+    """Space requests at least `interval` seconds apart across all threads and tasks"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def reserve(self) -> float:
+        """Claim the next request slot and return how many seconds to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+    
+    def wait(self) -> None:
+        """Block until this thread may send its request"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Shared by every ArxivClient and search path in the process: concurrent category
+# queries overlap their parsing, but their requests still go out one per interval
+_ARXIV_RATE_LIMITER = _RateLimiter(_ARXIV_REQUEST_INTERVAL)
+
+
+@lru_cache(maxsize=4096)
+def clean_text(text: str) -> str:
+    """
+    Clean up text by removing extra whitespace and line breaks
+    
+    Memoized because cross-listed papers come back once per category.
+    """
+    # Remove math expressions and common LaTeX commands in one regex pass,
+    # then normalize whitespace and line breaks (including gaps left by removals)
+    return ' '.join(_MARKUP_RE.sub('', text).split())
+
+
+class _PaperDerived:
+    """
+    Slots for Paper's text as received and the values it derives on first use
+    
+    Kept out of the dataclass fields so they stay out of __init__, repr,
+    comparisons and dataclasses.asdict().
+    """
+    __slots__ = (
+        '_raw_title', '_clean_title', '_raw_abstract', '_clean_abstract',
+        '_search_text_lower', '_published_iso', '_updated_iso'
+    )
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class Paper(_PaperDerived):
     """Represents an ArXiv paper"""
     title: str
     authors: List[str]
@@ -34,26 +142,34 @@ class Paper:
     summary: Optional[str] = None
     
     def __post_init__(self):
-        """Clean up title and abstract"""
-        self.title = self._clean_text(self.title)
-        self.abstract = self._clean_text(self.abstract)
-    
-    def _clean_text(self, text: str) -> str:
-        """Clean up text by removing extra whitespace and line breaks"""
-        # Remove extra whitespace and normalize line breaks
-        text = re.sub(r'\s+', ' ', text.strip())
-        # Remove common LaTeX commands
-        text = re.sub(r'\$[^$]*\$', '', text)  # Remove math expressions
-        text = re.sub(r'\\[a-zA-Z]+\{[^}]*\}', '', text)  # Remove LaTeX commands
-        return text.strip()
-    
-    def matches_keywords(self, keywords: List[str]) -> bool:
-        """Check if paper matches any of the provided keywords"""
-        if not keywords:
+        """Reset the derived values (title and abstract are cleaned on first read)"""
+        self._published_iso = None
+        self._updated_iso = None
+    
+    def matches_keywords(self, lowered_keywords: Tuple[str, ...]) -> bool:
+        """Check if paper matches any of the provided (already lower-cased) keywords"""
+        if not lowered_keywords:
             return True
         
-        text_to_search = f"{self.title} {self.abstract}".lower()
-        return any(keyword.lower() in text_to_search for keyword in keywords)
+        # Lower-cased title and abstract, built once per paper
+        text_to_search = self._search_text_lower
+        if text_to_search is None:
+            text_to_search = self._search_text_lower = f"{self.title} {self.abstract}".lower()
+        return any(keyword in text_to_search for keyword in lowered_keywords)
+    
+    @property
+    def published_iso(self) -> str:
+        """Publication time as an ISO 8601 string, formatted once per paper"""
+        if self._published_iso is None:
+            self._published_iso = self.published.isoformat()
+        return self._published_iso
+    
+    @property
+    def updated_iso(self) -> str:
+        """Last update time as an ISO 8601 string, formatted once per paper"""
+        if self._updated_iso is None:
+            self._updated_iso = self.updated.isoformat()
+        return self._updated_iso
     
     def to_dict(self) -> Dict:
         """Convert paper to dictionary format"""
@@ -62,8 +178,8 @@ class Paper:
             'authors': self.authors,
             'abstract': self.abstract,
             'categories': self.categories,
-            'published': self.published.isoformat(),
-            'updated': self.updated.isoformat(),
+            'published': self.published_iso,
+            'updated': self.updated_iso,
             'arxiv_id': self.arxiv_id,
             'pdf_url': self.pdf_url,
             'entry_id': self.entry_id,
@@ -71,12 +187,92 @@ class Paper:
         }
 
 
+def _cleaned_text_property(name: str) -> property:
+    """
+    Build the property for a Paper text field
+    
+    The text is stored as received and cleaned on first read, so papers dropped
+    before anything reads them (duplicates, out-of-window results) never pay
+    for the cleanup.
+    """
+    raw_attr = f'_raw_{name}'
+    clean_attr = f'_clean_{name}'
+    
+    def get(self) -> str:
+        value = getattr(self, clean_attr)
+        if value is None:
+            value = clean_text(getattr(self, raw_attr))
+            setattr(self, clean_attr, value)
+        return value
+    
+    def set(self, value: str) -> None:
+        setattr(self, raw_attr, value)
+        setattr(self, clean_attr, None)
+        self._search_text_lower = None
+    
+    return property(get, set, doc=f"Cleaned-up {name}")
+
+
+# Installed after the dataclass decorator, so title and abstract remain ordinary
+# fields (constructor arguments, repr, comparisons, asdict) that read cleaned text
+Paper.title = _cleaned_text_property('title')
+Paper.abstract = _cleaned_text_property('abstract')
+
+
+def _encode_search_entry(window_start: Optional[datetime], papers: List[Paper]) -> Dict:
+    """Plain-data form of a search cache entry, with times as ISO 8601 strings"""
+    return {
+        'window_start': window_start.isoformat() if window_start is not None else None,
+        'papers': [paper.to_dict() for paper in papers]
+    }
+
+
+def _decode_search_entry(entry: Dict) -> Tuple[Optional[datetime], List[Paper]]:
+    """Rebuild (window start, papers) from _encode_search_entry output"""
+    window_start = entry['window_start']
+    papers = []
+    for record in entry['papers']:
+        record = dict(record)
+        record['published'] = datetime.fromisoformat(record['published'])
+        record['updated'] = datetime.fromisoformat(record['updated'])
+        papers.append(Paper(**record))
+    return (datetime.fromisoformat(window_start) if window_start is not None else None), papers
+
+
 class ArxivClient:
     """Client for interacting with ArXiv API"""
     
-    def __init__(self, max_results_per_query: int = 100):
+    def __init__(
+        self,
+        max_results_per_query: int = 100,
+        max_workers: Optional[int] = None,
+        strict_date_check: bool = True,
+        cache_dir: Optional[Path] = Path("data/cache/arxiv")
+    ):
         self.max_results_per_query = max_results_per_query
+        self.max_workers = max_workers  # None: one worker per category, capped at _MAX_CONCURRENT_QUERIES
+        # The submittedDate query only has day precision, so results are re-checked
+        # against the exact window unless this is turned off
+        self.strict_date_check = strict_date_check
         self.logger = logging.getLogger(__name__)
+        
+        # (category, start, end, max_results) -> (stored_at, window start, papers), oldest first
+        self._search_cache: Dict[Tuple[str, str, str, int], Tuple[float, Optional[datetime], List[Paper]]] = {}
+        self._search_cache_lock = threading.Lock()
+        
+        # arxiv.Client keeps one HTTP session, so all category searches reuse its
+        # keep-alive connection; created on the first search (see _get_arxiv)
+        self._arxiv_client = None
+        self._arxiv_client_lock = threading.Lock()
+        
+        # Pickled query results; None disables the on-disk cache
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                self.logger.warning("Disabling search disk cache at %s: %s", self.cache_dir, e)
+                self.cache_dir = None
     
     def search_papers(
         self,
@@ -88,54 +284,161 @@ class ArxivClient:
         """
         Search for papers in specified categories and filter by keywords
         """
-        self.logger.info(f"Searching papers in categories: {categories}")
-        self.logger.info(f"Keywords: {keywords}")
-        self.logger.info(f"Looking back {days_back} days")
+        self.logger.info("Searching papers in categories: %s", categories)
+        self.logger.info("Keywords: %s", keywords)
+        self.logger.info("Looking back %s days", days_back)
         
-        # Calculate date range
-        end_date = datetime.now()
+        # Calculate date range (ArXiv timestamps are timezone-aware UTC)
+        end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=days_back)
         
-        all_papers = []
+        # Papers are deduplicated and keyword-filtered in one pass as categories complete
+        lowered_keywords = tuple(keyword.lower() for keyword in keywords) if keywords else ()
+        unique_papers: Dict[str, Paper] = {}
+        total_found = 0
         
-        for category in categories:
-            try:
-                papers = self._search_category(
+        for category, papers in self._search_categories(categories, start_date, end_date):
+            self.logger.info("Found %s papers in category %s", len(papers), category)
+            total_found += len(papers)
+            
+            for paper in papers:
+                if paper.arxiv_id in unique_papers:
+                    continue
+                if lowered_keywords and not paper.matches_keywords(lowered_keywords):
+                    continue
+                unique_papers[paper.arxiv_id] = paper
+        
+        if keywords:
+            self.logger.info("After deduplication and keyword filtering: %s of %s papers", len(unique_papers), total_found)
+        
+        # Newest max_papers papers, without sorting the whole collection
+        papers_list = heapq.nlargest(max_papers, unique_papers.values(), key=lambda p: p.published)
+        
+        self.logger.info("Final result: %s of %s papers (limit %s)", len(papers_list), len(unique_papers), max_papers)
+        return papers_list
+    
+    def _search_categories(
+        self,
+        categories: List[str],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Iterator[Tuple[str, List[Paper]]]:
+        """Yield (category, papers) for each category, searching them concurrently"""
+        if HTTPX_AVAILABLE:
+            yield from asyncio.run(self._search_papers_async(categories, start_date, end_date))
+            return
+        
+        # Category queries are independent and I/O-bound, so run them concurrently
+        max_workers = self.max_workers or min(_MAX_CONCURRENT_QUERIES, len(categories)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._search_category,
                     category=category,
                     start_date=start_date,
                     end_date=end_date,
                     max_results=self.max_results_per_query
+                ): category
+                for category in categories
+            }
+            
+            for future in as_completed(futures):
+                category = futures[future]
+                try:
+                    yield category, future.result()
+                except Exception as e:
+                    self.logger.error("Error searching category %s: %s", category, e)
+    
+    async def _search_papers_async(
+        self,
+        categories: List[str],
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Tuple[str, List[Paper]]]:
+        """Query all categories over one shared async HTTP client"""
+        import httpx
+        
+        # HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 without it
+        http2 = importlib.util.find_spec("h2") is not None
+        
+        # Same concurrency cap as the threaded path
+        semaphore = asyncio.Semaphore(self.max_workers or _MAX_CONCURRENT_QUERIES)
+        
+        async def search_limited(session: "httpx.AsyncClient", category: str) -> List[Paper]:
+            async with semaphore:
+                return await self._search_category_async(
+                    session, category, start_date, end_date, self.max_results_per_query
                 )
-                all_papers.extend(papers)
-                self.logger.info(f"Found {len(papers)} papers in category {category}")
-                
-            except Exception as e:
-                self.logger.error(f"Error searching category {category}: {e}")
+        
+        async with httpx.AsyncClient(http2=http2, timeout=30) as session:
+            results = await asyncio.gather(
+                *(search_limited(session, category) for category in categories),
+                return_exceptions=True
+            )
+        
+        category_papers = []
+        for category, result in zip(categories, results):
+            if isinstance(result, BaseException):
+                self.logger.error("Error searching category %s: %s", category, result)
                 continue
+            category_papers.append((category, result))
         
-        # Remove duplicates based on ArXiv ID
-        unique_papers = {}
-        for paper in all_papers:
-            if paper.arxiv_id not in unique_papers:
-                unique_papers[paper.arxiv_id] = paper
+        return category_papers
+    
+    async def _search_category_async(
+        self,
+        session: "httpx.AsyncClient",
+        category: str,
+        start_date: datetime,
+        end_date: datetime,
+        max_results: int = 100
+    ) -> List[Paper]:
+        """Search papers in a specific category with a single ArXiv API request"""
+        start_date_str = start_date.strftime("%Y%m%d")
+        end_date_str = end_date.strftime("%Y%m%d")
         
-        papers_list = list(unique_papers.values())
+        cache_key = (category, start_date_str, end_date_str, max_results)
+        cached_papers = self._get_cached_search(cache_key, start_date, end_date)
+        if cached_papers is not None:
+            self.logger.debug("Using cached results for category %s", category)
+            return cached_papers
         
-        # Filter by keywords if provided
-        if keywords:
-            papers_list = [p for p in papers_list if p.matches_keywords(keywords)]
-            self.logger.info(f"After keyword filtering: {len(papers_list)} papers")
+        params = {
+            "search_query": f"cat:{category} AND submittedDate:[{start_date_str} TO {end_date_str}]",
+            "start": 0,
+            "max_results": max_results,
+            "sortBy": "submittedDate",
+            "sortOrder": "descending",
+        }
         
-        # Sort by publication date (newest first)
-        papers_list.sort(key=lambda p: p.published, reverse=True)
+        try:
+            await asyncio.sleep(_ARXIV_RATE_LIMITER.reserve())
+            response = await session.get(_ARXIV_API_URL, params=params, timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            self.logger.error("Error in ArXiv search for category %s: %s", category, e)
+            return []
         
-        # Limit to max_papers
-        if len(papers_list) > max_papers:
-            papers_list = papers_list[:max_papers]
-            self.logger.info(f"Limited to {max_papers} papers")
+        papers = []
+        for _, elem in ET.iterparse(io.BytesIO(response.content), events=("end",)):
+            if elem.tag != _ATOM_ENTRY:
+                continue
+            
+            try:
+                published = _parse_atom_datetime(elem.findtext(f"{_ATOM_NS}published", ""))
+                
+                # Date check on the raw entry, before any Paper construction or text cleanup
+                if not self.strict_date_check or start_date <= published <= end_date:
+                    papers.append(self._entry_to_paper(elem, published))
+                    
+            except Exception as e:
+                self.logger.warning("Error processing feed entry in category %s: %s", category, e)
+            
+            # Drop the parsed entry so peak memory stays at one entry
+            elem.clear()
         
-        self.logger.info(f"Final result: {len(papers_list)} papers")
-        return papers_list
+        self._store_cached_search(cache_key, papers, start_date)
+        return papers
     
     def _search_category(
         self,
@@ -151,10 +454,20 @@ class ArxivClient:
         start_date_str = start_date.strftime("%Y%m%d")
         end_date_str = end_date.strftime("%Y%m%d")
         
+        # Repeats of the same day-range query within the TTL (e.g. daemon ticks) reuse the
+        # last result, re-filtered to this call's exact window
+        cache_key = (category, start_date_str, end_date_str, max_results)
+        cached_papers = self._get_cached_search(cache_key, start_date, end_date)
+        if cached_papers is not None:
+            self.logger.debug("Using cached results for category %s", category)
+            return cached_papers
+        
         # Create search query for category and date range
         search_query = f"cat:{category} AND submittedDate:[{start_date_str} TO {end_date_str}]"
         
         try:
+            arxiv = _get_arxiv()
+            
             # Create search
             search = arxiv.Search(
                 query=search_query,
@@ -163,35 +476,239 @@ class ArxivClient:
                 sort_order=arxiv.SortOrder.Descending
             )
             
+            # page_size equals max_results, so each category is a single request
+            _ARXIV_RATE_LIMITER.wait()
             papers = []
-            for result in search.results():
+            for result in self._get_arxiv_client().results(search):
                 try:
-                    paper = self._result_to_paper(result)
+                    # Date check on the raw result, before any Paper construction or text cleanup
+                    if self.strict_date_check and not (start_date <= result.published <= end_date):
+                        continue
                     
-                    # Additional date filtering (ArXiv search can be imprecise)
-                    if start_date <= paper.published <= end_date:
-                        papers.append(paper)
+                    papers.append(self._result_to_paper(result))
                         
                 except Exception as e:
-                    self.logger.warning(f"Error processing paper {result.entry_id}: {e}")
+                    self.logger.warning("Error processing paper %s: %s", result.entry_id, e)
                     continue
             
+            self._store_cached_search(cache_key, papers, start_date)
             return papers
             
         except Exception as e:
-            self.logger.error(f"Error in ArXiv search for category {category}: {e}")
+            self.logger.error("Error in ArXiv search for category %s: %s", category, e)
             return []
     
+    def _get_arxiv_client(self):
+        """Return the shared arxiv.Client, creating it on first use"""
+        with self._arxiv_client_lock:
+            if self._arxiv_client is None:
+                self._arxiv_client = _get_arxiv().Client(
+                    page_size=self.max_results_per_query,
+                    delay_seconds=_ARXIV_REQUEST_INTERVAL,
+                    num_retries=3
+                )
+            return self._arxiv_client
+    
+    def _get_cached_search(
+        self,
+        cache_key: Tuple[str, str, str, int],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[List[Paper]]:
+        """Return cached papers for a query window if a fresh entry covers it"""
+        with self._search_cache_lock:
+            entry = self._search_cache.get(cache_key)
+            if entry is not None:
+                stored_at, window_start, papers = entry
+                if time.monotonic() - stored_at >= _SEARCH_CACHE_TTL:
+                    del self._search_cache[cache_key]
+                    entry = None
+        
+        if entry is None:
+            loaded = self._load_disk_cache(cache_key)
+            if loaded is None:
+                return None
+            window_start, papers = loaded
+        
+        return self._reuse_cached_papers(window_start, papers, start_date, end_date)
+    
+    def _reuse_cached_papers(
+        self,
+        window_start: Optional[datetime],
+        papers: List[Paper],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[List[Paper]]:
+        """
+        Filter cached results to a requested window
+        
+        The cache key has day precision, so an entry can hold results filtered
+        from a later start time than the one requested; those entries are misses.
+        
+        Args:
+            window_start: Start time the entry was filtered from (None if unfiltered)
+            papers: Cached papers
+            start_date: Requested window start
+            end_date: Requested window end
+            
+        Returns:
+            Copies of the papers in the window, or None if the entry does not cover it
+        """
+        if window_start is not None and (not self.strict_date_check or start_date < window_start):
+            return None
+        
+        # Copies, so per-run changes such as paper.summary never leak into the cache
+        return [
+            copy.copy(paper) for paper in papers
+            if not self.strict_date_check or start_date <= paper.published <= end_date
+        ]
+    
+    def _store_cached_search(
+        self,
+        cache_key: Tuple[str, str, str, int],
+        papers: List[Paper],
+        start_date: datetime
+    ) -> None:
+        """Cache non-empty query results in memory and on disk"""
+        if not papers:
+            return
+        
+        # The caller goes on to modify its papers, so the cache keeps its own copies
+        window_start = start_date if self.strict_date_check else None
+        cached = [copy.copy(paper) for paper in papers]
+        self._remember_search(cache_key, window_start, cached, time.monotonic())
+        self._write_disk_cache(cache_key, window_start, cached)
+    
+    def _remember_search(
+        self,
+        cache_key: Tuple[str, str, str, int],
+        window_start: Optional[datetime],
+        papers: List[Paper],
+        stored_at: float
+    ) -> None:
+        """Add query results to the in-process cache, evicting the oldest entries first"""
+        with self._search_cache_lock:
+            self._search_cache.pop(cache_key, None)
+            while len(self._search_cache) >= _SEARCH_CACHE_MAX_ENTRIES:
+                del self._search_cache[next(iter(self._search_cache))]
+            self._search_cache[cache_key] = (stored_at, window_start, papers)
+    
+    def _disk_cache_file(self, cache_key: Tuple[str, str, str, int], suffix: str) -> Path:
+        """Path of the on-disk cache entry for a query"""
+        key = hashlib.blake2b("|".join(map(str, cache_key)).encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}{suffix}"
+    
+    def _load_disk_cache(
+        self,
+        cache_key: Tuple[str, str, str, int]
+    ) -> Optional[Tuple[Optional[datetime], List[Paper]]]:
+        """
+        Return (window start, papers) from the on-disk cache if the entry is within its TTL
+        
+        MessagePack entries are read when msgspec is installed; pickle entries
+        (written without msgspec, or by older versions) are still accepted.
+        """
+        if self.cache_dir is None:
+            return None
+        
+        suffixes = (".msgpack", ".pkl") if MSGSPEC_AVAILABLE else (".pkl",)
+        for suffix in suffixes:
+            cache_file = self._disk_cache_file(cache_key, suffix)
+            try:
+                age = time.time() - cache_file.stat().st_mtime
+                if age >= _SEARCH_CACHE_TTL:
+                    continue
+                if suffix == ".msgpack":
+                    loaded = _decode_search_entry(load_msgpack(cache_file))
+                else:
+                    loaded = pickle.loads(cache_file.read_bytes())
+                window_start, papers = loaded
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                self.logger.warning("Ignoring unreadable search cache file %s: %s", cache_file, e)
+                continue
+            
+            # Keep the entry's real age so promotion into memory does not extend its TTL
+            self._remember_search(cache_key, window_start, papers, time.monotonic() - age)
+            return window_start, papers
+        
+        return None
+    
+    def _write_disk_cache(
+        self,
+        cache_key: Tuple[str, str, str, int],
+        window_start: Optional[datetime],
+        papers: List[Paper]
+    ) -> None:
+        """Atomically write query results to the on-disk cache (MessagePack if msgspec is installed)"""
+        if self.cache_dir is None:
+            return
+        
+        cache_file = self._disk_cache_file(cache_key, ".msgpack" if MSGSPEC_AVAILABLE else ".pkl")
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                if MSGSPEC_AVAILABLE:
+                    os.close(fd)
+                    if not save_msgpack(_encode_search_entry(window_start, papers), tmp_path):
+                        raise OSError("MessagePack encoding failed")
+                else:
+                    with os.fdopen(fd, "wb") as f:
+                        pickle.dump((window_start, papers), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            self.logger.warning("Could not write search cache file %s: %s", cache_file, e)
+    
     def _result_to_paper(self, result) -> Paper:
         """Convert ArXiv search result to Paper object"""
         return Paper(
             title=result.title,
-            authors=[str(author) for author in result.authors],
+            authors=_author_names(result.authors),
             abstract=result.summary,
-            categories=result.categories,
+            categories=result.categories,  # shared with the result, not copied; Paper treats it as read-only
             published=result.published,
             updated=result.updated,
             arxiv_id=result.get_short_id(),
             pdf_url=result.pdf_url,
             entry_id=result.entry_id
         )
+    
+    def _entry_to_paper(self, entry: ET.Element, published: datetime) -> Paper:
+        """Convert an Atom feed <entry> element (with its parsed publish time) to Paper object"""
+        entry_id = entry.findtext(f"{_ATOM_NS}id", "")
+        
+        pdf_url = ""
+        for link in entry.iterfind(f"{_ATOM_NS}link"):
+            if link.get("title") == "pdf":
+                pdf_url = link.get("href", "")
+                break
+        
+        return Paper(
+            title=entry.findtext(f"{_ATOM_NS}title", ""),
+            authors=[name.text or "" for name in entry.iterfind(f"{_ATOM_NS}author/{_ATOM_NS}name")],
+            abstract=entry.findtext(f"{_ATOM_NS}summary", ""),
+            categories=[cat.get("term", "") for cat in entry.iterfind(f"{_ATOM_NS}category")],
+            published=published,
+            updated=_parse_atom_datetime(entry.findtext(f"{_ATOM_NS}updated", "")),
+            arxiv_id=entry_id.split("/abs/")[-1],
+            pdf_url=pdf_url,
+            entry_id=entry_id
+        )
+
+
+def _author_names(authors) -> List[str]:
+    """Author names from arxiv.Result.Author objects, read directly from .name"""
+    try:
+        return [author.name for author in authors]
+    except AttributeError:
+        # Fall back to str() if the arxiv library ever drops the name attribute
+        return [str(author) for author in authors]
+
+
+def _parse_atom_datetime(value: str) -> datetime:
+    """Parse an Atom timestamp such as 2024-01-01T12:00:00Z as aware UTC"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -9,43 +9,123 @@ GitHub: https://github.com/Sreeram5678
 For licensing inquiries, contact: sreeram.lagisetty@gmail.com
 """
 
+import os
 import sys
 import time
+import multiprocessing
+import selectors
 import signal
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import traceback
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.config.settings import config_manager
+from src.config.settings import get_config_manager, SummarizerSettings
 from src.arxiv_bot.arxiv_client import ArxivClient, Paper
 from src.arxiv_bot.summarizer import PaperSummarizer
+from src.arxiv_bot.summary_cache import SummaryCache
 from src.arxiv_bot.scheduler import ArxivScheduler
 from src.notifications.email_handler import EmailHandler
 from src.notifications.telegram_handler import TelegramHandler
 from src.notifications.slack_handler import SlackHandler
 from src.utils.logger import setup_logging, get_logger
 from src.utils.helpers import (
-    ensure_directory, save_json, load_json,
+    ensure_directory, save_json, load_json, load_json_mmap, append_jsonl, tail_jsonl,
     deduplicate_papers, create_summary_statistics, batch_list
 )
 
+# Minutes the summarizer model stays loaded after a scheduled digest
+SUMMARIZER_IDLE_MINUTES = 30
+
+# Health checks kept in memory (one week of hourly checks)
+HEALTH_HISTORY_SIZE = 168
+
+
+class DigestCancelled(Exception):
+    """Raised inside a digest run once a stop signal has been received"""
+
+
+# Summarizer held by each process-pool worker (see _init_summarizer_worker)
+_worker_summarizer = None
+
+
+def _cuda_available() -> bool:
+    """Check for a CUDA device without failing when torch is missing"""
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+def _summarizer_options(settings: SummarizerSettings) -> Dict:
+    """Model-loading options for PaperSummarizer, shared by the bot and its worker processes"""
+    return {
+        'model_name': settings.model_name,
+        'precision': settings.precision,
+        'torch_compile': settings.torch_compile,
+    }
+
+
+def _init_summarizer_worker(options: Dict, num_workers: int) -> None:
+    """Process-pool initializer: load one summarizer per worker process (options: see _summarizer_options)"""
+    global _worker_summarizer
+    
+    # Split the cores between workers instead of every worker using all of them
+    try:
+        import torch
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // num_workers))
+    except ImportError:
+        pass
+    
+    _worker_summarizer = PaperSummarizer(device="cpu", **options)
+
+
+def _summarize_in_worker(job: Tuple[str, str, int, int]):
+    """Process-pool task: summarize one (title, abstract, max_length, min_length) job"""
+    title, abstract, max_length, min_length = job
+    try:
+        result = _worker_summarizer.summarize_paper(
+            title=title,
+            abstract=abstract,
+            max_length=max_length,
+            min_length=min_length
+        )
+    except Exception as e:
+        # Not every exception pickles; send back its type name and message instead
+        return (type(e).__name__, str(e))
+    
+    # Plain fields pickle reliably back to the parent process
+    return SimpleNamespace(
+        summary=result.summary,
+        confidence=result.confidence,
+        model_used=result.model_used,
+        processing_time=result.processing_time
+    )
+
 
 class ArxivBot:
     """Main ArXiv Bot class that orchestrates all operations"""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, split_results: bool = False):
         """
         Initialize ArXiv Bot
         
         Args:
             config_path: Path to configuration file
+            split_results: Also write separate papers_*.json and summaries_*.json files
         """
         # Load configuration
+        config_manager = get_config_manager()
         if config_path:
             config_manager.config_path = config_path
             config_manager.config = config_manager._load_config()
@@ -62,7 +142,10 @@ class ArxivBot:
         
         # Initialize components
         self.arxiv_client = None
-        self.summarizer = None
+        self._summarizer = None  # loaded on first use, see the summarizer property
+        self._summarizer_lock = threading.Lock()
+        self._digest_lock = threading.Lock()
+        self.summary_cache = None
         self.scheduler = None
         self.email_handler = None
         self.telegram_handler = None
@@ -70,7 +153,14 @@ class ArxivBot:
         
         # Runtime state
         self.running = False
-        self.last_run_file = Path(self.config.data_dir) / "last_run.json"
+        # Set by main()'s signal handlers (a plain flag, no locks); a running digest
+        # checks it between papers and stops early
+        self.stop_request = SimpleNamespace(requested=False)
+        # Append-only JSON Lines logs; the last line is the current state
+        self.last_run_file = Path(self.config.data_dir) / "last_run.jsonl"
+        self.health_file = Path(self.config.data_dir) / "health_status.jsonl"
+        self.health_history = deque(maxlen=HEALTH_HISTORY_SIZE)
+        self.split_results = split_results
         
         self.logger.info("ArXiv Bot initialized")
     
@@ -80,15 +170,14 @@ class ArxivBot:
             self.logger.info("Initializing bot components...")
             
             # Initialize ArXiv client
-            self.arxiv_client = ArxivClient()
+            self.arxiv_client = ArxivClient(cache_dir=Path(self.config.data_dir) / "cache" / "arxiv")
             self.logger.info("ArXiv client initialized")
             
-            # Initialize summarizer
-            self.summarizer = PaperSummarizer(
-                model_name=self.config.summarizer.model_name,
-                device="auto"
-            )
-            self.logger.info("Summarizer initialized")
+            # The summarizer model is loaded on first use (see the summarizer property)
+            
+            # Load cached summaries from previous runs
+            self.summary_cache = SummaryCache(Path(self.config.data_dir) / "summary_cache.json")
+            self.logger.info(f"Summary cache loaded ({len(self.summary_cache)} entries)")
             
             # Initialize scheduler
             self.scheduler = ArxivScheduler(timezone=self.config.timezone)
@@ -119,6 +208,40 @@ class ArxivBot:
             self.logger.error(f"Error initializing components: {e}")
             raise
     
+    @property
+    def summarizer(self) -> PaperSummarizer:
+        """Summarization model, loaded the first time a digest needs it"""
+        with self._summarizer_lock:
+            if self._summarizer is None:
+                self._summarizer = PaperSummarizer(
+                    device="auto", **_summarizer_options(self.config.summarizer)
+                )
+                self.logger.info("Summarizer initialized")
+            return self._summarizer
+    
+    def unload_summarizer(self) -> None:
+        """Release the summarization model until the next digest needs it"""
+        with self._summarizer_lock:
+            if self._summarizer is None:
+                return
+            self._summarizer.cleanup()
+            self._summarizer = None
+        self.logger.info("Summarizer unloaded")
+    
+    def _check_stop_request(self) -> None:
+        """Abort the running digest (DigestCancelled) once a stop signal has arrived"""
+        if self.stop_request.requested:
+            raise DigestCancelled()
+    
+    def _unload_idle_summarizer(self) -> None:
+        """Scheduled after each digest: free the model unless a digest is running"""
+        if not self._digest_lock.acquire(blocking=False):
+            return  # that digest schedules its own unload when it finishes
+        try:
+            self.unload_summarizer()
+        finally:
+            self._digest_lock.release()
+    
     def setup_scheduling(self) -> None:
         """Setup scheduled tasks"""
         try:
@@ -206,16 +329,32 @@ class ArxivBot:
                 self.scheduler.stop()
             
             # Cleanup summarizer
-            if self.summarizer:
-                self.summarizer.cleanup()
+            self.unload_summarizer()
             
             self.logger.info("ArXiv Bot stopped successfully")
             
         except Exception as e:
             self.logger.error(f"Error stopping bot: {e}")
+        
+        # Log records are written by a background thread; drain it before exiting
+        # (main() then closes the sinks, which flushes the buffered log files)
+        self.logger_instance.flush()
     
     def run_paper_digest(self) -> None:
         """Main function to fetch papers, summarize, and send notifications"""
+        with self._digest_lock:
+            self._run_paper_digest()
+        
+        # Keep the model warm for a while, then give its memory back until the next run
+        if self.scheduler and self.scheduler.is_running() and self._summarizer is not None:
+            self.scheduler.add_one_time_job(
+                func=self._unload_idle_summarizer,
+                run_date=datetime.now(timezone.utc) + timedelta(minutes=SUMMARIZER_IDLE_MINUTES),
+                job_id="unload_summarizer"
+            )
+    
+    def _run_paper_digest(self) -> None:
+        """Fetch papers, summarize, and send notifications (caller holds the digest lock)"""
         try:
             self.logger.info("Starting paper digest run...")
             start_time = time.time()
@@ -223,19 +362,26 @@ class ArxivBot:
             # Fetch papers
             papers = self.fetch_papers()
             if not papers:
+                # Return before anything touches self.summarizer, so quiet days
+                # (weekends, holidays, all IDs already processed) never load the model
                 self.logger.info("No new papers found")
                 return
             
             self.logger.info(f"Found {len(papers)} papers")
             
             # Summarize papers
+            self._check_stop_request()
             summaries = self.summarize_papers(papers)
+            self._check_stop_request()
+            
+            # Serialize papers once for saving, notifications and statistics
+            papers_data = [paper.to_dict() for paper in papers]
             
             # Save results
-            self.save_results(papers, summaries)
+            self.save_results(papers, summaries, papers_data=papers_data)
             
             # Send notifications
-            self.send_notifications(papers, summaries)
+            self.send_notifications(papers, summaries, papers_data=papers_data)
             
             # Update last run timestamp
             self.update_last_run()
@@ -245,12 +391,12 @@ class ArxivBot:
             self.logger.info(f"Paper digest completed in {duration:.2f} seconds")
             
             # Create and log statistics
-            stats = create_summary_statistics(
-                [paper.to_dict() for paper in papers],
-                [summary.__dict__ for summary in summaries]
-            )
+            stats = create_summary_statistics(papers_data, summaries)
             self.logger.info(f"Digest statistics: {stats}")
             
+        except DigestCancelled:
+            self.logger.info("Paper digest cancelled by stop request")
+            
         except Exception as e:
             self.logger.error(f"Error in paper digest run: {e}")
             self.logger.error(traceback.format_exc())
@@ -270,6 +416,12 @@ class ArxivBot:
                 max_papers=self.config.arxiv.max_papers_per_day
             )
             
+            # A paper listed in several categories must only be summarized once
+            unique_papers = list({paper.arxiv_id: paper for paper in papers}.values())
+            if len(unique_papers) != len(papers):
+                self.logger.info(f"Deduplicated to {len(unique_papers)} unique papers")
+            papers = unique_papers
+            
             # Filter out papers we've already processed
             papers = self.filter_new_papers(papers)
             
@@ -282,23 +434,25 @@ class ArxivBot:
     
     def filter_new_papers(self, papers: List[Paper]) -> List[Paper]:
         """Filter out papers that have already been processed"""
-        # Load previously processed paper IDs
+        # Load previously processed papers as {arxiv_id: published ISO timestamp}
         processed_file = Path(self.config.data_dir) / "processed_papers.json"
-        processed_ids = set(load_json(processed_file) or [])
+        processed = load_json(processed_file) or {}  # large files are memory-mapped
         
-        # Filter new papers
-        new_papers = [paper for paper in papers if paper.arxiv_id not in processed_ids]
+        # Older versions stored a plain list of IDs; keep them for this run's cutoff window
+        if isinstance(processed, list):
+            now_iso = datetime.now(timezone.utc).isoformat()
+            processed = dict.fromkeys(processed, now_iso)
         
-        # Update processed IDs
-        all_ids = processed_ids.union(paper.arxiv_id for paper in papers)
+        # Filter new papers
+        new_papers = [paper for paper in papers if paper.arxiv_id not in processed]
         
-        # Keep only recent IDs (last 30 days worth)
-        cutoff_date = datetime.now() - timedelta(days=30)
-        recent_papers = [p for p in papers if p.published >= cutoff_date]
-        recent_ids = set(p.arxiv_id for p in recent_papers)
+        # Keep only recent IDs (last 30 days worth); ISO strings in UTC compare chronologically
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+        processed = {arxiv_id: published for arxiv_id, published in processed.items() if published >= cutoff}
+        processed.update((paper.arxiv_id, paper.published_iso) for paper in papers)
         
         # Save updated processed IDs
-        save_json(list(recent_ids), processed_file)
+        save_json(processed, processed_file)
         
         return new_papers
     
@@ -307,68 +461,178 @@ class ArxivBot:
         try:
             self.logger.info(f"Summarizing {len(papers)} papers...")
             
-            summaries = []
+            summaries: List[Optional[Dict]] = [None] * len(papers)
+            pending: List[Tuple[int, str]] = []  # (index, cache key) of papers needing the model
+            
+            for index, paper in enumerate(papers):
+                # Reuse the summary from an earlier run with identical inputs
+                cache_key = SummaryCache.make_key(
+                    self.config.summarizer.model_name,
+                    self.config.summarizer.max_summary_length,
+                    self.config.summarizer.min_summary_length,
+                    paper.title,
+                    paper.abstract
+                )
+                cached = self.summary_cache.lookup(cache_key) if self.summary_cache is not None else None
+                if cached is not None:
+                    summaries[index] = {
+                        'arxiv_id': paper.arxiv_id,
+                        **cached,
+                        'processing_time': 0.0
+                    }
+                else:
+                    pending.append((index, cache_key))
             
-            # Process papers in batches to manage memory
-            for batch in batch_list(papers, batch_size=5):
-                batch_summaries = []
+            # Cache misses go to the model; with none, the model is never loaded
+            pending_papers = [papers[index] for index, _ in pending]
+            if pending_papers:
+                results = self._summarize_pending(pending_papers)
+            else:
+                self.logger.info("All summaries served from cache")
+                results = []
+            
+            for (index, cache_key), paper, result in zip(pending, pending_papers, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error summarizing paper {paper.arxiv_id}: {result}")
+                    # Add empty summary
+                    summaries[index] = {
+                        'arxiv_id': paper.arxiv_id,
+                        'summary': f"Summary unavailable: {str(result)}",
+                        'confidence': 0.0,
+                        'model_used': 'error',
+                        'processing_time': 0.0
+                    }
+                    continue
                 
-                for paper in batch:
-                    try:
-                        self.logger.info(f"Summarizing: {paper.title[:50]}...")
-                        
-                        result = self.summarizer.summarize_paper(
-                            title=paper.title,
-                            abstract=paper.abstract,
-                            max_length=self.config.summarizer.max_summary_length,
-                            min_length=self.config.summarizer.min_summary_length
-                        )
-                        
-                        summary_dict = {
-                            'arxiv_id': paper.arxiv_id,
-                            'summary': result.summary,
-                            'confidence': result.confidence,
-                            'model_used': result.model_used,
-                            'processing_time': result.processing_time
-                        }
-                        
-                        batch_summaries.append(summary_dict)
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error summarizing paper {paper.arxiv_id}: {e}")
-                        # Add empty summary
-                        batch_summaries.append({
-                            'arxiv_id': paper.arxiv_id,
-                            'summary': f"Summary unavailable: {str(e)}",
-                            'confidence': 0.0,
-                            'model_used': 'error',
-                            'processing_time': 0.0
-                        })
+                summaries[index] = {
+                    'arxiv_id': paper.arxiv_id,
+                    'summary': result.summary,
+                    'confidence': result.confidence,
+                    'model_used': result.model_used,
+                    'processing_time': result.processing_time
+                }
                 
-                summaries.extend(batch_summaries)
+                if self.summary_cache is not None:
+                    self.summary_cache.update(cache_key, {
+                        'summary': result.summary,
+                        'confidence': result.confidence,
+                        'model_used': result.model_used
+                    })
+            
+            if self.summary_cache is not None and not self.summary_cache.save():
+                self.logger.warning("Failed to save summary cache")
             
             self.logger.info(f"Completed summarization of {len(summaries)} papers")
             return summaries
             
+        except DigestCancelled:
+            raise
+            
         except Exception as e:
             self.logger.error(f"Error summarizing papers: {e}")
             return []
     
-    def save_results(self, papers: List[Paper], summaries: List[Dict]) -> None:
-        """Save papers and summaries to disk"""
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            # Save papers
-            papers_data = [paper.to_dict() for paper in papers]
-            papers_file = Path(self.config.data_dir) / "papers" / f"papers_{timestamp}.json"
-            save_json(papers_data, papers_file)
+    def _summarize_pending(self, papers: List[Paper]) -> List:
+        """
+        Summarize papers that missed the cache
+        
+        Args:
+            papers: Papers to summarize
             
-            # Save summaries
-            summaries_file = Path(self.config.data_dir) / "summaries" / f"summaries_{timestamp}.json"
-            save_json(summaries, summaries_file)
+        Returns:
+            One summarization result per paper, or the exception it failed with
+        """
+        num_workers = self.config.summarizer.num_workers
+        if num_workers > 1 and len(papers) > 1 and not _cuda_available():
+            return self._summarize_in_processes(papers, num_workers)
+        
+        return self._summarize_each(papers)
+    
+    def _summarize_in_processes(self, papers: List[Paper], num_workers: int) -> List:
+        """Summarize papers on a pool of CPU worker processes, one model copy each"""
+        num_workers = min(num_workers, len(papers))
+        self.logger.info(f"Summarizing {len(papers)} papers on {num_workers} worker processes...")
+        
+        jobs = [
+            (
+                paper.title,
+                paper.abstract,
+                self.config.summarizer.max_summary_length,
+                self.config.summarizer.min_summary_length
+            )
+            for paper in papers
+        ]
+        
+        try:
+            # Spawn rather than fork: the scheduler, log writer and torch threads may hold
+            # locks at fork time; the initializer rebuilds all per-worker state anyway
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_summarizer_worker,
+                initargs=(_summarizer_options(self.config.summarizer), num_workers)
+            ) as executor:
+                results = list(executor.map(_summarize_in_worker, jobs, chunksize=4))
+        except Exception as e:
+            # e.g. a worker died while loading the model (or on Ctrl+C); summarize
+            # in-process instead unless the bot is stopping
+            self._check_stop_request()
+            self.logger.warning(f"Process pool summarization failed, falling back to in-process: {e}")
+            return self._summarize_each(papers)
+        
+        # Failed jobs come back as (exception type name, message)
+        return [
+            RuntimeError(f"{result[0]}: {result[1]}") if isinstance(result, tuple) else result
+            for result in results
+        ]
+    
+    def _summarize_each(self, papers: List[Paper]) -> List:
+        """
+        Summarize papers in-process, one model call each
+        
+        Args:
+            papers: Papers to summarize
             
-            # Save combined data
+        Returns:
+            One summarization result per paper, or the exception it failed with
+        """
+        max_length = self.config.summarizer.max_summary_length
+        min_length = self.config.summarizer.min_summary_length
+        
+        # Failures are kept per paper, so one bad input only loses its own summary
+        results = []
+        for paper in papers:
+            self._check_stop_request()
+            try:
+                self.logger.info(f"Summarizing: {paper.title[:50]}...")
+                results.append(self.summarizer.summarize_paper(
+                    title=paper.title,
+                    abstract=paper.abstract,
+                    max_length=max_length,
+                    min_length=min_length
+                ))
+            except Exception as e:
+                results.append(e)
+        
+        return results
+    
+    def save_results(
+        self,
+        papers: List[Paper],
+        summaries: List[Dict],
+        papers_data: Optional[List[Dict]] = None
+    ) -> None:
+        """Save papers and summaries to disk (papers_data: already serialized papers)"""
+        try:
+            # Derive both parts from one clock reading; the nanosecond suffix keeps
+            # two digests saved within the same second from overwriting each other
+            now_ns = time.time_ns()
+            timestamp = datetime.fromtimestamp(now_ns // 1_000_000_000).strftime("%Y%m%d_%H%M%S")
+            file_suffix = f"{timestamp}_{now_ns % 1_000_000_000:09d}"
+            if papers_data is None:
+                papers_data = [paper.to_dict() for paper in papers]
+            
+            # The combined digest is the authoritative record and is encoded once
             combined_data = {
                 'timestamp': timestamp,
                 'papers': papers_data,
@@ -380,54 +644,65 @@ class ArxivBot:
                 }
             }
             
-            combined_file = Path(self.config.data_dir) / f"digest_{timestamp}.json"
-            save_json(combined_data, combined_file)
+            combined_file = Path(self.config.data_dir) / f"digest_{file_suffix}.json"
+            if not save_json(combined_data, combined_file):
+                self.logger.error(f"Failed to write {combined_file}")
+                return
             
             self.logger.info(f"Results saved to {combined_file}")
             
+            # Separate papers/summaries files duplicate the digest; only on request
+            if self.split_results:
+                papers_file = Path(self.config.data_dir) / "papers" / f"papers_{file_suffix}.json"
+                save_json(papers_data, papers_file)
+                
+                summaries_file = Path(self.config.data_dir) / "summaries" / f"summaries_{file_suffix}.json"
+                save_json(summaries, summaries_file)
+            
         except Exception as e:
             self.logger.error(f"Error saving results: {e}")
     
-    def send_notifications(self, papers: List[Paper], summaries: List[Dict]) -> None:
-        """Send notifications via configured channels"""
+    def send_notifications(
+        self,
+        papers: List[Paper],
+        summaries: List[Dict],
+        papers_data: Optional[List[Dict]] = None
+    ) -> None:
+        """Send notifications via configured channels (papers_data: already serialized papers)"""
         try:
             self.logger.info("Sending notifications...")
             
             # Convert papers to dict format for notifications
-            papers_dict = [paper.to_dict() for paper in papers]
-            
-            # Send email notification
-            if self.email_handler:
-                try:
-                    success = self.email_handler.send_digest(papers_dict, summaries)
-                    if success:
-                        self.logger.info("Email notification sent successfully")
-                    else:
-                        self.logger.error("Failed to send email notification")
-                except Exception as e:
-                    self.logger.error(f"Error sending email notification: {e}")
-            
-            # Send Telegram notification
-            if self.telegram_handler:
-                try:
-                    success = self.telegram_handler.send_digest(papers_dict, summaries)
-                    if success:
-                        self.logger.info("Telegram notification sent successfully")
-                    else:
-                        self.logger.error("Failed to send Telegram notification")
-                except Exception as e:
-                    self.logger.error(f"Error sending Telegram notification: {e}")
+            papers_dict = papers_data if papers_data is not None else [paper.to_dict() for paper in papers]
+            
+            channels = [
+                (name, handler)
+                for name, handler in (
+                    ("Email", self.email_handler),
+                    ("Telegram", self.telegram_handler),
+                    ("Slack", self.slack_handler),
+                )
+                if handler
+            ]
+            if not channels:
+                return
             
-            # Send Slack notification
-            if self.slack_handler:
-                try:
-                    success = self.slack_handler.send_digest(papers_dict, summaries)
-                    if success:
-                        self.logger.info("Slack notification sent successfully")
-                    else:
-                        self.logger.error("Failed to send Slack notification")
-                except Exception as e:
-                    self.logger.error(f"Error sending Slack notification: {e}")
+            # Each channel is a blocking network round trip, so send them concurrently
+            with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+                futures = {
+                    executor.submit(handler.send_digest, papers_dict, summaries): name
+                    for name, handler in channels
+                }
+                
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        if future.result():
+                            self.logger.info(f"{name} notification sent successfully")
+                        else:
+                            self.logger.error(f"Failed to send {name} notification")
+                    except Exception as e:
+                        self.logger.error(f"Error sending {name} notification: {e}")
             
         except Exception as e:
             self.logger.error(f"Error sending notifications: {e}")
@@ -456,7 +731,12 @@ class ArxivBot:
             'timestamp': datetime.now().isoformat(),
             'status': 'success'
         }
-        save_json(last_run_data, self.last_run_file)
+        append_jsonl(last_run_data, self.last_run_file)
+    
+    def get_last_run(self) -> Optional[Dict]:
+        """Return the most recent last-run record, if any"""
+        records = tail_jsonl(self.last_run_file, n=1)
+        return records[0] if records else None
     
     def health_check(self) -> None:
         """Perform health check"""
@@ -467,30 +747,58 @@ class ArxivBot:
             health_status = {
                 'timestamp': datetime.now().isoformat(),
                 'arxiv_client': self.arxiv_client is not None,
-                'summarizer': self.summarizer is not None,
+                'summarizer_loaded': self._summarizer is not None,
                 'scheduler': self.scheduler.is_running() if self.scheduler else False,
                 'email_handler': self.email_handler is not None and self.config.email.enabled,
                 'telegram_handler': self.telegram_handler is not None and self.config.telegram.enabled,
                 'slack_handler': self.slack_handler is not None and self.config.slack.enabled
             }
             
-            # Save health status
-            health_file = Path(self.config.data_dir) / "health_status.json"
-            save_json(health_status, health_file)
+            # Record health status
+            self.health_history.append(health_status)
+            append_jsonl(health_status, self.health_file)
             
             self.logger.info(f"Health check completed: {health_status}")
             
         except Exception as e:
             self.logger.error(f"Error in health check: {e}")
     
+    def history(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Load saved digests, newest first
+        
+        Args:
+            limit: Maximum number of digests to load (all if None)
+            
+        Returns:
+            List of digest dictionaries as written by save_results
+        """
+        # digest_YYYYmmdd_HHMMSS[_nnnnnnnnn].json names sort chronologically
+        digest_files = sorted(Path(self.config.data_dir).glob("digest_*.json"), reverse=True)
+        if limit is not None:
+            digest_files = digest_files[:limit]
+        
+        digests = []
+        for digest_file in digest_files:
+            digest = load_json_mmap(digest_file)
+            if digest is not None:
+                digests.append(digest)
+        return digests
+    
+    def tail_health(self, n: int = 24) -> List[Dict]:
+        """Return the last n health checks, oldest first"""
+        if not self.health_history:
+            # Nothing checked in this process yet; use the log from earlier runs
+            return tail_jsonl(self.health_file, n=n)
+        return list(self.health_history)[-n:]
+    
     def run_once(self) -> None:
         """Run the digest once (for testing or manual execution)"""
         self.logger.info("Running paper digest once...")
         self.initialize_components()
         self.run_paper_digest()
         
-        if self.summarizer:
-            self.summarizer.cleanup()
+        self.unload_summarizer()
     
     def test_notifications(self) -> None:
         """Test all notification channels"""
@@ -511,6 +819,141 @@ class ArxivBot:
             self.logger.info(f"Slack test: {'Success' if success else 'Failed'}")
 
 
+def handle_command(bot: ArxivBot, command: str) -> bool:
+    """
+    Execute one interactive command
+    
+    Args:
+        bot: Running bot instance
+        command: Lower-cased command text
+        
+    Returns:
+        False when the command asks to quit, True otherwise
+    """
+    if command == "run":
+        bot.run_paper_digest()
+    elif command == "test":
+        bot.test_notifications()
+    elif command == "status":
+        jobs = bot.scheduler.list_jobs() if bot.scheduler else {}
+        print(f"Bot running: {bot.running}")
+        last_run = bot.get_last_run()
+        print(f"Last digest: {last_run['timestamp'] if last_run else 'never'}")
+        recent_health = bot.tail_health(n=1)
+        print(f"Last health check: {recent_health[-1]['timestamp'] if recent_health else 'never'}")
+        print(f"Scheduled jobs: {len(jobs)}")
+        for job_id, job_info in jobs.items():
+            print(f"  {job_id}: {job_info}")
+    elif command in ["quit", "exit", "stop"]:
+        return False
+    elif command:
+        print("Unknown command. Available: run, test, status, quit")
+    
+    return True
+
+
+@contextmanager
+def signal_wakeup_pipe():
+    """
+    Have caught signals write to a pipe while the block runs (POSIX only)
+    
+    Yields:
+        The pipe's read end, which becomes readable when a signal arrives, or None
+        on platforms without select() support for it
+    """
+    if os.name != "posix":
+        yield None
+        return
+    
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_w, False)
+    previous_wakeup_fd = signal.set_wakeup_fd(wake_w)
+    try:
+        yield wake_r
+    finally:
+        signal.set_wakeup_fd(previous_wakeup_fd)
+        os.close(wake_r)
+        os.close(wake_w)
+
+
+def run_interactive(bot: ArxivBot, stop_request: SimpleNamespace, wake_r: Optional[int]) -> None:
+    """
+    Read and execute commands from stdin until quit, EOF, a stop signal or the bot stops
+    
+    Args:
+        bot: Running bot
+        stop_request: Namespace whose 'requested' flag the signal handlers set
+        wake_r: Read end of the signal wakeup pipe (see signal_wakeup_pipe), or None
+    """
+    selector = None
+    if wake_r is not None:
+        selector = selectors.DefaultSelector()
+        try:
+            # epoll refuses regular files and /dev/null (EPERM); those use input()
+            selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+        except (OSError, ValueError):
+            selector.close()
+            selector = None
+    
+    if selector is None:
+        # Windows cannot select() on stdin, and stdin may not be selectable at
+        # all; fall back to blocking input()
+        while bot.running and not stop_request.requested:
+            try:
+                command = input("> ").strip().lower()
+            except EOFError:
+                break
+            if stop_request.requested or not handle_command(bot, command):
+                break
+        return
+    
+    # Wait on stdin and the signal wakeup pipe with one selector, so the loop
+    # sleeps in the kernel and returns as soon as SIGINT/SIGTERM arrives.
+    # stdin is read unbuffered so no typed-ahead line is stuck in Python's buffer.
+    stdin_fd = sys.stdin.fileno()
+    pending = ""
+    
+    with selector:
+        selector.register(wake_r, selectors.EVENT_READ)
+        print("> ", end="", flush=True)
+        
+        while bot.running and not stop_request.requested:
+            ready = {key.fd for key, _ in selector.select(timeout=None)}
+            
+            if wake_r in ready:
+                os.read(wake_r, 512)
+                continue  # the loop condition sees stop_request
+            
+            if stdin_fd not in ready:
+                continue
+            
+            data = os.read(stdin_fd, 4096)
+            if not data:  # EOF; run a final unterminated command, if any
+                handle_command(bot, pending.strip().lower())
+                break
+            
+            pending += data.decode(errors="replace")
+            while "\n" in pending:
+                line, pending = pending.split("\n", 1)
+                if not handle_command(bot, line.strip().lower()):
+                    return
+                print("> ", end="", flush=True)
+
+
+def wait_until_stopped(bot: ArxivBot, stop_request: SimpleNamespace, wake_r: Optional[int]) -> None:
+    """Block until a stop signal arrives or the bot stops (daemon mode)"""
+    while bot.running and not stop_request.requested:
+        if wake_r is None:
+            time.sleep(1.0)
+            continue
+        
+        # Sleeps in the kernel until a caught signal writes to the wakeup pipe
+        with selectors.DefaultSelector() as selector:
+            selector.register(wake_r, selectors.EVENT_READ)
+            selector.select(timeout=None)
+        os.read(wake_r, 512)
+
+
 def main():
     """Main entry point"""
     import argparse
@@ -520,20 +963,16 @@ def main():
     parser.add_argument("--run-once", action="store_true", help="Run digest once and exit")
     parser.add_argument("--test-notifications", action="store_true", help="Test notification channels")
     parser.add_argument("--daemon", action="store_true", help="Run as daemon")
+    parser.add_argument(
+        "--split-results",
+        action="store_true",
+        help="Also write separate papers/ and summaries/ JSON files next to each digest"
+    )
     
     args = parser.parse_args()
     
     # Create bot instance
-    bot = ArxivBot(config_path=args.config)
-    
-    # Setup signal handlers for graceful shutdown
-    def signal_handler(signum, frame):
-        print("\nReceived interrupt signal. Shutting down gracefully...")
-        bot.stop()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    bot = ArxivBot(config_path=args.config, split_results=args.split_results)
     
     try:
         if args.run_once:
@@ -541,46 +980,43 @@ def main():
         elif args.test_notifications:
             bot.test_notifications()
         else:
-            # Start bot and keep it running
-            bot.start()
-            
-            if args.daemon:
-                # Run as daemon
-                print("ArXiv Bot running as daemon. Press Ctrl+C to stop.")
-                while bot.running:
-                    time.sleep(1)
-            else:
-                # Interactive mode
-                print("ArXiv Bot started. Commands: 'run', 'test', 'status', 'quit'")
-                while bot.running:
-                    try:
-                        command = input("> ").strip().lower()
-                        
-                        if command == "run":
-                            bot.run_paper_digest()
-                        elif command == "test":
-                            bot.test_notifications()
-                        elif command == "status":
-                            jobs = bot.scheduler.list_jobs() if bot.scheduler else {}
-                            print(f"Bot running: {bot.running}")
-                            print(f"Scheduled jobs: {len(jobs)}")
-                            for job_id, job_info in jobs.items():
-                                print(f"  {job_id}: {job_info}")
-                        elif command in ["quit", "exit", "stop"]:
-                            break
-                        else:
-                            print("Unknown command. Available: run, test, status, quit")
-                    
-                    except EOFError:
-                        break
-                    except KeyboardInterrupt:
-                        break
-            
-            bot.stop()
+            # Signal handlers only set a plain flag: taking a lock there (as
+            # threading.Event.set() does) can deadlock against the interrupted
+            # main thread. The wakeup pipe wakes the waits below, a digest started
+            # with 'run' stops at its next paper, and the actual shutdown
+            # (scheduler, model cleanup) runs on the main thread.
+            stop_request = bot.stop_request
+            
+            def signal_handler(signum, frame):
+                stop_request.requested = True
+            
+            with signal_wakeup_pipe() as wake_r:
+                signal.signal(signal.SIGINT, signal_handler)
+                signal.signal(signal.SIGTERM, signal_handler)
+                
+                # Start bot and keep it running
+                bot.start()
+                
+                try:
+                    if args.daemon:
+                        # Run as daemon
+                        print("ArXiv Bot running as daemon. Press Ctrl+C to stop.")
+                        wait_until_stopped(bot, stop_request, wake_r)
+                    else:
+                        # Interactive mode
+                        print("ArXiv Bot started. Commands: 'run', 'test', 'status', 'quit'")
+                        run_interactive(bot, stop_request, wake_r)
+                finally:
+                    # Also runs if the wait fails, so the scheduler and model are released
+                    if stop_request.requested:
+                        print("\nReceived interrupt signal. Shutting down gracefully...")
+                    bot.stop()
     
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        bot.logger_instance.close()
 
 
 if __name__ == "__main__":
@@ -10,15 +10,53 @@ For licensing inquiries, contact: sreeram.lagisetty@gmail.com
 """
 
 import logging
-import schedule
-import time
-import threading
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import count
 from typing import Callable, Optional, Dict, Any
+from apscheduler.jobstores.base import ConflictingIdError, JobLookupError
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-import pytz
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python 3.8
+    from backports.zoneinfo import ZoneInfo
+
+
+# Day names in CronTrigger order (Monday = 0)
+_DAY_NAMES = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+_DAY_NUMBERS = {day: number for number, day in enumerate(_DAY_NAMES)}
+
+
+@lru_cache(maxsize=32)
+def _get_tz(name: str) -> ZoneInfo:
+    """Return the (shared) ZoneInfo for a timezone name"""
+    return ZoneInfo(name)
+
+
+# Cron triggers hold no per-job state, so one instance can serve every job with
+# the same schedule. Interval triggers are not cached: each one anchors its
+# first run to the time it was created.
+@lru_cache(maxsize=256)
+def _daily_trigger(hour: int, minute: int, tz_key: str) -> CronTrigger:
+    """Return the cron trigger for a daily run at hour:minute"""
+    return CronTrigger(hour=hour, minute=minute, timezone=_get_tz(tz_key))
+
+
+@lru_cache(maxsize=256)
+def _weekly_trigger(day_num: int, hour: int, minute: int, tz_key: str) -> CronTrigger:
+    """Return the cron trigger for a weekly run on day_num (Monday = 0) at hour:minute"""
+    return CronTrigger(day_of_week=day_num, hour=hour, minute=minute, timezone=_get_tz(tz_key))
+
+
+def _format_next_run(job) -> str:
+    """Describe when a job runs next (APScheduler sets it once the scheduler starts)"""
+    next_run_time = getattr(job, 'next_run_time', None)
+    if next_run_time is None:
+        return "when the scheduler starts"
+    return next_run_time.strftime('%Y-%m-%d %H:%M:%S %Z')
 
 
 class ArxivScheduler:
@@ -32,15 +70,12 @@ class ArxivScheduler:
             timezone: Timezone for scheduling (e.g., 'UTC', 'US/Eastern')
         """
         self.logger = logging.getLogger(__name__)
-        self.timezone = pytz.timezone(timezone)
+        self.timezone = _get_tz(timezone)
         
         # Use APScheduler for more robust scheduling
         self.scheduler = BackgroundScheduler(timezone=self.timezone)
         self.jobs = {}  # Track scheduled jobs
-        
-        # Simple schedule for basic operations
-        self.simple_scheduler_thread = None
-        self.simple_scheduler_running = False
+        self._simple_job_numbers = count(1)  # Unique suffixes for add_simple_* job ids
         
         self.logger.info(f"Scheduler initialized with timezone: {timezone}")
     
@@ -50,9 +85,6 @@ class ArxivScheduler:
             self.scheduler.start()
             self.logger.info("APScheduler started successfully")
             
-            # Start simple scheduler in background thread
-            self._start_simple_scheduler()
-            
         except Exception as e:
             self.logger.error(f"Error starting scheduler: {e}")
             raise
@@ -64,12 +96,6 @@ class ArxivScheduler:
             if self.scheduler.running:
                 self.scheduler.shutdown(wait=True)
                 self.logger.info("APScheduler stopped")
-            
-            # Stop simple scheduler
-            self.simple_scheduler_running = False
-            if self.simple_scheduler_thread and self.simple_scheduler_thread.is_alive():
-                self.simple_scheduler_thread.join(timeout=5)
-                self.logger.info("Simple scheduler stopped")
                 
         except Exception as e:
             self.logger.error(f"Error stopping scheduler: {e}")
@@ -100,12 +126,8 @@ class ArxivScheduler:
             if job_id in self.jobs:
                 self.remove_job(job_id)
             
-            # Create cron trigger for daily execution
-            trigger = CronTrigger(
-                hour=hour,
-                minute=minute,
-                timezone=self.timezone
-            )
+            # Cron trigger for daily execution (shared by jobs with the same time)
+            trigger = _daily_trigger(hour, minute, self.timezone.key)
             
             job = self.scheduler.add_job(
                 func=func,
@@ -119,12 +141,12 @@ class ArxivScheduler:
             
             self.jobs[job_id] = job
             
-            next_run = job.next_run_time.strftime('%Y-%m-%d %H:%M:%S %Z')
+            next_run = _format_next_run(job)
             self.logger.info(f"Daily job '{job_id}' scheduled for {hour:02d}:{minute:02d}. Next run: {next_run}")
             
             return True
             
-        except Exception as e:
+        except (ConflictingIdError, ValueError) as e:
             self.logger.error(f"Error adding daily job '{job_id}': {e}")
             return False
     
@@ -156,23 +178,12 @@ class ArxivScheduler:
             if job_id in self.jobs:
                 self.remove_job(job_id)
             
-            # Map day names to numbers (Monday = 0)
-            day_map = {
-                'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-                'friday': 4, 'saturday': 5, 'sunday': 6
-            }
-            
-            day_num = day_map.get(day_of_week.lower())
+            day_num = _DAY_NUMBERS.get(day_of_week.lower())
             if day_num is None:
                 raise ValueError(f"Invalid day of week: {day_of_week}")
             
-            # Create cron trigger for weekly execution
-            trigger = CronTrigger(
-                day_of_week=day_num,
-                hour=hour,
-                minute=minute,
-                timezone=self.timezone
-            )
+            # Cron trigger for weekly execution (shared by jobs with the same time)
+            trigger = _weekly_trigger(day_num, hour, minute, self.timezone.key)
             
             job = self.scheduler.add_job(
                 func=func,
@@ -186,12 +197,12 @@ class ArxivScheduler:
             
             self.jobs[job_id] = job
             
-            next_run = job.next_run_time.strftime('%Y-%m-%d %H:%M:%S %Z')
+            next_run = _format_next_run(job)
             self.logger.info(f"Weekly job '{job_id}' scheduled for {day_of_week}s at {hour:02d}:{minute:02d}. Next run: {next_run}")
             
             return True
             
-        except Exception as e:
+        except (ConflictingIdError, ValueError) as e:
             self.logger.error(f"Error adding weekly job '{job_id}': {e}")
             return False
     
@@ -236,12 +247,12 @@ class ArxivScheduler:
             
             self.jobs[job_id] = job
             
-            next_run = job.next_run_time.strftime('%Y-%m-%d %H:%M:%S %Z')
+            next_run = _format_next_run(job)
             self.logger.info(f"Interval job '{job_id}' scheduled every {interval_minutes} minutes. Next run: {next_run}")
             
             return True
             
-        except Exception as e:
+        except (ConflictingIdError, ValueError) as e:
             self.logger.error(f"Error adding interval job '{job_id}': {e}")
             return False
     
@@ -267,13 +278,14 @@ class ArxivScheduler:
         try:
             # Ensure run_date is timezone-aware
             if run_date.tzinfo is None:
-                run_date = self.timezone.localize(run_date)
+                run_date = run_date.replace(tzinfo=self.timezone)
             
             job = self.scheduler.add_job(
                 func=func,
                 trigger='date',
                 run_date=run_date,
                 id=job_id,
+                replace_existing=True,  # re-adding an ID reschedules it
                 kwargs=kwargs
             )
             
@@ -283,82 +295,52 @@ class ArxivScheduler:
             
             return True
             
-        except Exception as e:
+        except (ConflictingIdError, ValueError) as e:
             self.logger.error(f"Error adding one-time job '{job_id}': {e}")
             return False
     
     def remove_job(self, job_id: str) -> bool:
         """Remove a scheduled job"""
+        if job_id not in self.jobs:
+            self.logger.warning(f"Job '{job_id}' not found")
+            return False
+        
         try:
-            if job_id in self.jobs:
-                self.scheduler.remove_job(job_id)
-                del self.jobs[job_id]
-                self.logger.info(f"Job '{job_id}' removed")
-                return True
-            else:
-                self.logger.warning(f"Job '{job_id}' not found")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Error removing job '{job_id}': {e}")
+            self.scheduler.remove_job(job_id)
+        except JobLookupError:
+            # Already gone from APScheduler (e.g. a one-time job that has run)
+            del self.jobs[job_id]
+            self.logger.warning(f"Job '{job_id}' had already been removed")
             return False
+        
+        del self.jobs[job_id]
+        self.logger.info(f"Job '{job_id}' removed")
+        return True
     
     def get_job_info(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get information about a scheduled job"""
-        try:
-            if job_id not in self.jobs:
-                return None
-            
-            job = self.jobs[job_id]
-            
-            return {
-                'id': job.id,
-                'name': job.name,
-                'func': job.func.__name__ if hasattr(job.func, '__name__') else str(job.func),
-                'trigger': str(job.trigger),
-                'next_run_time': job.next_run_time.isoformat() if job.next_run_time else None,
-                'pending': job.pending
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error getting job info for '{job_id}': {e}")
-            return None
+        job = self.jobs.get(job_id)
+        return self._job_info(job) if job is not None else None
     
     def list_jobs(self) -> Dict[str, Dict[str, Any]]:
         """List all scheduled jobs"""
-        job_list = {}
-        
-        for job_id, job in self.jobs.items():
-            job_list[job_id] = self.get_job_info(job_id)
-        
-        return job_list
+        return {job_id: self._job_info(job) for job_id, job in self.jobs.items()}
     
-    def _start_simple_scheduler(self) -> None:
-        """Start simple scheduler in a background thread"""
-        def run_simple_scheduler():
-            self.simple_scheduler_running = True
-            self.logger.info("Simple scheduler thread started")
-            
-            while self.simple_scheduler_running:
-                try:
-                    schedule.run_pending()
-                    time.sleep(1)
-                except Exception as e:
-                    self.logger.error(f"Error in simple scheduler: {e}")
-                    time.sleep(5)  # Wait before retrying
-            
-            self.logger.info("Simple scheduler thread stopped")
-        
-        self.simple_scheduler_thread = threading.Thread(
-            target=run_simple_scheduler,
-            daemon=True,
-            name="SimpleScheduler"
-        )
-        self.simple_scheduler_thread.start()
+    def _job_info(self, job) -> Dict[str, Any]:
+        """Describe a scheduled job as a dictionary"""
+        next_run_time = getattr(job, 'next_run_time', None)  # unset until the scheduler starts
+        return {
+            'id': job.id,
+            'name': job.name,
+            'func': job.func.__name__ if hasattr(job.func, '__name__') else str(job.func),
+            'trigger': str(job.trigger),
+            'next_run_time': next_run_time.isoformat() if next_run_time else None,
+            'pending': job.pending
+        }
     
     def add_simple_daily_job(self, func: Callable, time_str: str = "09:00") -> bool:
         """
-        Add a daily job using simple scheduler (fallback)
+        Add a daily job from an HH:MM time string
         
         Args:
             func: Function to execute
@@ -368,17 +350,20 @@ class ArxivScheduler:
             True if job added successfully
         """
         try:
-            schedule.every().day.at(time_str).do(func)
-            self.logger.info(f"Simple daily job scheduled for {time_str}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error adding simple daily job: {e}")
+            hour, minute = map(int, time_str.split(":"))
+        except ValueError:
+            self.logger.error(f"Error adding simple daily job: invalid time '{time_str}'")
             return False
+        
+        # Every call adds its own job, as the schedule library did
+        return self.add_daily_job(
+            func, hour=hour, minute=minute,
+            job_id=f"simple_daily_{hour:02d}{minute:02d}_{next(self._simple_job_numbers)}"
+        )
     
     def add_simple_weekly_job(self, func: Callable, day: str, time_str: str = "09:00") -> bool:
         """
-        Add a weekly job using simple scheduler (fallback)
+        Add a weekly job from a day name and an HH:MM time string
         
         Args:
             func: Function to execute
@@ -389,38 +374,25 @@ class ArxivScheduler:
             True if job added successfully
         """
         try:
-            day_lower = day.lower()
-            
-            if day_lower == "monday":
-                schedule.every().monday.at(time_str).do(func)
-            elif day_lower == "tuesday":
-                schedule.every().tuesday.at(time_str).do(func)
-            elif day_lower == "wednesday":
-                schedule.every().wednesday.at(time_str).do(func)
-            elif day_lower == "thursday":
-                schedule.every().thursday.at(time_str).do(func)
-            elif day_lower == "friday":
-                schedule.every().friday.at(time_str).do(func)
-            elif day_lower == "saturday":
-                schedule.every().saturday.at(time_str).do(func)
-            elif day_lower == "sunday":
-                schedule.every().sunday.at(time_str).do(func)
-            else:
-                raise ValueError(f"Invalid day: {day}")
-            
-            self.logger.info(f"Simple weekly job scheduled for {day} at {time_str}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error adding simple weekly job: {e}")
+            hour, minute = map(int, time_str.split(":"))
+        except ValueError:
+            self.logger.error(f"Error adding simple weekly job: invalid time '{time_str}'")
             return False
+        
+        return self.add_weekly_job(
+            func,
+            day_of_week=day,
+            hour=hour,
+            minute=minute,
+            job_id=f"simple_weekly_{day.lower()}_{hour:02d}{minute:02d}_{next(self._simple_job_numbers)}"
+        )
     
     def is_running(self) -> bool:
         """Check if scheduler is running"""
-        return self.scheduler.running and self.simple_scheduler_running
+        return self.scheduler.running
     
     def get_next_run_time(self, job_id: str) -> Optional[datetime]:
         """Get next run time for a specific job"""
         if job_id in self.jobs:
-            return self.jobs[job_id].next_run_time
+            return getattr(self.jobs[job_id], 'next_run_time', None)
         return None
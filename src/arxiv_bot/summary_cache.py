@@ -0,0 +1,84 @@
+"""
+Summary cache for ArXiv Bot
+Reuses summaries of papers that were already summarized with the same settings
+
+Author: Sreeram Lagisetty
+Email: sreeram.lagisetty@gmail.com
+GitHub: https://github.com/Sreeram5678
+
+For licensing inquiries, contact: sreeram.lagisetty@gmail.com
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from src.utils.helpers import save_json, load_json, generate_fast_hash
+
+
+class SummaryCache:
+    """Exact-match cache of paper summaries, persisted as a JSON file"""
+    
+    def __init__(self, cache_file: Union[str, Path], max_entries: int = 5000):
+        """
+        Initialize summary cache
+        
+        Args:
+            cache_file: JSON file the cache is loaded from and saved to
+            max_entries: Maximum number of summaries kept (oldest dropped first)
+        """
+        self.cache_file = Path(cache_file)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._dirty = False
+        
+        # key -> cached summary fields, oldest first
+        self._entries: Dict[str, Dict] = load_json(self.cache_file) or {}
+    
+    @staticmethod
+    def make_key(model: str, max_length: int, min_length: int, title: str, abstract: str) -> str:
+        """
+        Build the cache key for a summarization request
+        
+        Args:
+            model: Summarization model name
+            max_length: Maximum summary length
+            min_length: Minimum summary length
+            title: Paper title
+            abstract: Paper abstract
+        
+        Returns:
+            Hex digest identifying the request (BLAKE3, or BLAKE2b without blake3)
+        """
+        raw_key = f"{model}|{max_length}|{min_length}|{title}|{abstract}"
+        return generate_fast_hash(raw_key)
+    
+    def lookup(self, key: str) -> Optional[Dict]:
+        """Return the cached summary fields for a key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return dict(entry) if entry is not None else None
+    
+    def update(self, key: str, value: Dict) -> None:
+        """Store summary fields for a key, evicting the oldest entries first"""
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = dict(value)
+            self._dirty = True
+    
+    def save(self) -> bool:
+        """Write the cache to disk if it changed since the last save"""
+        with self._lock:
+            if not self._dirty:
+                return True
+            
+            if not save_json(self._entries, self.cache_file, indent=None):
+                return False
+            
+            self._dirty = False
+            return True
+    
+    def __len__(self) -> int:
+        return len(self._entries)
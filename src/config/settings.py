@@ -10,13 +10,78 @@ For licensing inquiries, contact: sreeram.lagisetty@gmail.com
 """
 
 import os
+import sys
+import copy
 import yaml
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from pathlib import Path
 
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed YAML files: absolute path -> (mtime_ns, size, data); an entry is
+# replaced when the file changes, so reloads never accumulate stale copies
+_YAML_CACHE: Dict[str, Tuple[int, int, Dict]] = {}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value"""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+def _parse_list(value: str) -> List[str]:
+    """Parse a comma-separated environment value"""
+    return [item.strip() for item in value.split(',')]
+
+
+# Environment variable -> (config section, key)
+_ENV_MAPPINGS = {
+    # ArXiv settings
+    'ARXIV_CATEGORIES': ('arxiv', 'categories'),
+    'ARXIV_KEYWORDS': ('arxiv', 'keywords'),
+    'ARXIV_MAX_PAPERS': ('arxiv', 'max_papers_per_day'),
+    'ARXIV_FREQUENCY': ('arxiv', 'search_frequency'),
+    
+    # Email settings
+    'EMAIL_ENABLED': ('email', 'enabled'),
+    'SMTP_SERVER': ('email', 'smtp_server'),
+    'SMTP_PORT': ('email', 'smtp_port'),
+    'SENDER_EMAIL': ('email', 'sender_email'),
+    'SENDER_PASSWORD': ('email', 'sender_password'),
+    'RECIPIENT_EMAIL': ('email', 'recipient_email'),
+    
+    # Telegram settings
+    'TELEGRAM_ENABLED': ('telegram', 'enabled'),
+    'TELEGRAM_BOT_TOKEN': ('telegram', 'bot_token'),
+    'TELEGRAM_CHAT_ID': ('telegram', 'chat_id'),
+    
+    # Slack settings
+    'SLACK_ENABLED': ('slack', 'enabled'),
+    'SLACK_WEBHOOK_URL': ('slack', 'webhook_url'),
+    'SLACK_CHANNEL': ('slack', 'channel'),
+    
+    # Summarizer settings
+    'SUMMARIZER_MODEL': ('summarizer', 'model_name'),
+    'SUMMARIZER_API_KEY': ('summarizer', 'api_key'),
+    'SUMMARIZER_PRECISION': ('summarizer', 'precision'),
+}
+
+# Config keys whose environment values are not plain strings
+_ENV_CONVERTERS = {
+    'enabled': _parse_bool,
+    'max_papers_per_day': int,
+    'smtp_port': int,
+    'categories': _parse_list,
+    'keywords': _parse_list,
+}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ArxivSettings:
     """ArXiv search configuration"""
     categories: List[str]  # e.g., ['cs.AI', 'cs.LG', 'quant-ph']
@@ -26,17 +91,21 @@ class ArxivSettings:
     days_lookback: int = 1  # How many days back to search
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SummarizerSettings:
     """AI summarization configuration"""
-    model_name: str = "facebook/bart-large-cnn"
+    model_name: str = "sshleifer/distilbart-cnn-12-6"
     max_summary_length: int = 150
     min_summary_length: int = 50
     use_local_model: bool = True
     api_key: Optional[str] = None  # For external APIs like OpenAI
+    precision: str = "fp32"  # fp32, bf16, fp16, int8
+    batch_size: int = 8  # Papers per generate() call (arxiv_bot_simple.py)
+    torch_compile: bool = False  # Wrap the PyTorch model in torch.compile
+    num_workers: int = 1  # CPU-only: summarizer processes (each holds its own model copy)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EmailSettings:
     """Email notification configuration"""
     enabled: bool = False
@@ -48,7 +117,7 @@ class EmailSettings:
     subject_prefix: str = "[ArXiv Digest]"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TelegramSettings:
     """Telegram notification configuration"""
     enabled: bool = False
@@ -56,7 +125,7 @@ class TelegramSettings:
     chat_id: str = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SlackSettings:
     """Slack notification configuration"""
     enabled: bool = False
@@ -64,7 +133,7 @@ class SlackSettings:
     channel: str = "#general"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BotConfig:
     """Main bot configuration"""
     arxiv: ArxivSettings
@@ -91,10 +160,7 @@ class ConfigManager:
     def _load_config(self) -> BotConfig:
         """Load configuration from file and environment variables"""
         # Load from YAML file if exists
-        config_data = {}
-        if os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
+        config_data = self._read_yaml(self.config_path)
         
         # Override with environment variables
         config_data = self._merge_env_vars(config_data)
@@ -105,53 +171,47 @@ class ConfigManager:
         
         return self._dict_to_config(config_data)
     
+    def _read_yaml(self, path: str) -> Dict:
+        """
+        Parse a YAML config file, reusing the result while the file is unchanged
+        
+        Args:
+            path: Path to the YAML file
+            
+        Returns:
+            A private copy of the parsed data ({} if the file does not exist)
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return {}
+        
+        abspath = os.path.abspath(path)
+        cached = _YAML_CACHE.get(abspath)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            data = cached[2]
+        else:
+            with open(path, 'r') as f:
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
+            _YAML_CACHE[abspath] = (stat.st_mtime_ns, stat.st_size, data)
+        
+        # Callers merge environment variables into the result in place
+        return copy.deepcopy(data)
+    
     def _merge_env_vars(self, config_data: Dict) -> Dict:
         """Merge environment variables into config"""
-        env_mappings = {
-            # ArXiv settings
-            'ARXIV_CATEGORIES': ('arxiv', 'categories'),
-            'ARXIV_KEYWORDS': ('arxiv', 'keywords'),
-            'ARXIV_MAX_PAPERS': ('arxiv', 'max_papers_per_day'),
-            'ARXIV_FREQUENCY': ('arxiv', 'search_frequency'),
+        env = os.environ
+        for env_var, (section, key) in _ENV_MAPPINGS.items():
+            value = env.get(env_var)
+            if value is None:
+                continue
             
-            # Email settings
-            'EMAIL_ENABLED': ('email', 'enabled'),
-            'SMTP_SERVER': ('email', 'smtp_server'),
-            'SMTP_PORT': ('email', 'smtp_port'),
-            'SENDER_EMAIL': ('email', 'sender_email'),
-            'SENDER_PASSWORD': ('email', 'sender_password'),
-            'RECIPIENT_EMAIL': ('email', 'recipient_email'),
+            # Type conversion
+            converter = _ENV_CONVERTERS.get(key)
+            if converter is not None:
+                value = converter(value)
             
-            # Telegram settings
-            'TELEGRAM_ENABLED': ('telegram', 'enabled'),
-            'TELEGRAM_BOT_TOKEN': ('telegram', 'bot_token'),
-            'TELEGRAM_CHAT_ID': ('telegram', 'chat_id'),
-            
-            # Slack settings
-            'SLACK_ENABLED': ('slack', 'enabled'),
-            'SLACK_WEBHOOK_URL': ('slack', 'webhook_url'),
-            'SLACK_CHANNEL': ('slack', 'channel'),
-            
-            # Summarizer settings
-            'SUMMARIZER_MODEL': ('summarizer', 'model_name'),
-            'SUMMARIZER_API_KEY': ('summarizer', 'api_key'),
-        }
-        
-        for env_var, (section, key) in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                if section not in config_data:
-                    config_data[section] = {}
-                
-                # Type conversion
-                if key in ['enabled']:
-                    value = value.lower() in ('true', '1', 'yes', 'on')
-                elif key in ['max_papers_per_day', 'smtp_port']:
-                    value = int(value)
-                elif key in ['categories', 'keywords']:
-                    value = [item.strip() for item in value.split(',')]
-                
-                config_data[section][key] = value
+            config_data.setdefault(section, {})[key] = value
         
         return config_data
     
@@ -166,11 +226,15 @@ class ConfigManager:
                 'days_lookback': 1
             },
             'summarizer': {
-                'model_name': 'facebook/bart-large-cnn',
+                'model_name': 'sshleifer/distilbart-cnn-12-6',
                 'max_summary_length': 150,
                 'min_summary_length': 50,
                 'use_local_model': True,
-                'api_key': None
+                'api_key': None,
+                'precision': 'fp32',
+                'batch_size': 8,
+                'torch_compile': False,
+                'num_workers': 1
             },
             'email': {
                 'enabled': False,
@@ -210,5 +274,15 @@ class ConfigManager:
         )
 
 
-# Global configuration instance
-config_manager = ConfigManager()
+@lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Return the global configuration manager, loading config.yaml on first use"""
+    return ConfigManager()
+
+
+def __getattr__(name: str):
+    # Keep `from src.config.settings import config_manager` working without
+    # reading the config file when the module is merely imported
+    if name == 'config_manager':
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,14 +10,68 @@ For licensing inquiries, contact: sreeram.lagisetty@gmail.com
 """
 
 import os
+import sys
+import time
 import json
 import hashlib
+import mmap
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Any, Optional, Union
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from itertools import islice
 import re
-import pickle
-from urllib.parse import urlparse
+from collections import Counter
+
+# Optional fast JSON backend; the stdlib json module is used without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional BLAKE3 for generate_fast_hash; BLAKE2b (also faster than SHA-256
+# without SHA extensions) is used without it, with BLAKE3's 32-byte digest size
+try:
+    from blake3 import blake3 as _fast_hasher
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    _fast_hasher = partial(hashlib.blake2b, digest_size=32)
+    BLAKE3_AVAILABLE = False
+
+# load_json parses files larger than this from a memory map (orjson only)
+JSON_MMAP_MIN_SIZE = 1024 * 1024
+
+# Optional MessagePack backend for binary caches
+try:
+    import msgspec
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder()
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# safe_filename maps these to '_' with str.translate: reserved characters plus
+# everything str.isspace() (and so the regex \s) accepts; all of it is below U+3001
+_UNSAFE_FILENAME_TABLE = str.maketrans(dict.fromkeys(
+    '<>:"/\\|?*' + ''.join(chr(c) for c in range(0x3001) if chr(c).isspace()), '_'
+))
+
+# datetime.fromisoformat() understands a trailing 'Z' from Python 3.11
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Units used by format_file_size
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Precompiled patterns (the re module's own cache is small and shared)
+_MULTI_UNDERSCORE_RE = re.compile(r'_{2,}')
+_HTML_TAG_RE = re.compile(r'<.*?>')
+_ARXIV_NEW_ID_RE = re.compile(r'\d{4}\.\d{4,5}(?:v\d+)?')
+_ARXIV_ID_RE = re.compile(
+    r'(?:arxiv:|arXiv:|https?://arxiv\.org/abs/)?'
+    r'(?:(?P<new>\d{4}\.\d{4,5}(?:v\d+)?)|(?P<old>[a-z-]+(?:\.[A-Z]{2})?/\d{7}(?:v\d+)?))'
+)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 
 def ensure_directory(path: Union[str, Path]) -> Path:
@@ -39,9 +93,8 @@ def safe_filename(filename: str, max_length: int = 100) -> str:
         Safe filename string
     """
     # Remove or replace invalid characters
-    safe_chars = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    safe_chars = re.sub(r'\s+', '_', safe_chars)
-    safe_chars = re.sub(r'_{2,}', '_', safe_chars)
+    safe_chars = filename.translate(_UNSAFE_FILENAME_TABLE)
+    safe_chars = _MULTI_UNDERSCORE_RE.sub('_', safe_chars)
     
     # Remove leading/trailing underscores and dots
     safe_chars = safe_chars.strip('_.')
@@ -57,12 +110,68 @@ def safe_filename(filename: str, max_length: int = 100) -> str:
     return safe_chars
 
 
-def generate_file_hash(content: Union[str, bytes]) -> str:
-    """Generate SHA-256 hash of content"""
+def generate_file_hash(content: Union[str, bytes, Path, BinaryIO]) -> str:
+    """
+    Generate SHA-256 hash of content
+    
+    Args:
+        content: Text or bytes to hash, a Path to a file, or a binary file object;
+            files are hashed in chunks instead of being read into memory
+        
+    Returns:
+        Hex digest
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(content).hexdigest()
+    
+    if isinstance(content, Path):
+        with open(content, 'rb') as f:
+            return _hash_stream(f)
+    
+    return _hash_stream(content)
+
+
+def generate_fast_hash(content: Union[str, bytes, Path, BinaryIO]) -> str:
+    """
+    Generate a fast non-cryptographic content hash for cache keys
+    
+    Uses BLAKE3 when the blake3 package is installed and BLAKE2b otherwise, so
+    digests are only comparable between runs of the same environment; use
+    generate_file_hash() where a stable SHA-256 is needed.
+    
+    Args:
+        content: Text or bytes to hash, a Path to a file, or a binary file object
+        
+    Returns:
+        Hex digest
+    """
     if isinstance(content, str):
         content = content.encode('utf-8')
     
-    return hashlib.sha256(content).hexdigest()
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return _fast_hasher(content).hexdigest()
+    
+    if isinstance(content, Path):
+        with open(content, 'rb') as f:
+            return _hash_stream(f, _fast_hasher)
+    
+    return _hash_stream(content, _fast_hasher)
+
+
+def _hash_stream(f: BinaryIO, hasher=None) -> str:
+    """Hex digest of a binary file object, read in chunks (SHA-256 by default)"""
+    if hasher is None:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        hasher = hashlib.sha256
+    
+    digest = hasher()
+    while chunk := f.read(1 << 20):
+        digest.update(chunk)
+    return digest.hexdigest()
 
 
 def save_json(data: Any, filepath: Union[str, Path], indent: int = 2) -> bool:
@@ -81,8 +190,26 @@ def save_json(data: Any, filepath: Union[str, Path], indent: int = 2) -> bool:
         filepath = Path(filepath)
         ensure_directory(filepath.parent)
         
+        # orjson only supports compact or 2-space output
+        if ORJSON_AVAILABLE and indent in (None, 2):
+            # Datetimes are passed through to default=str so output matches the stdlib path
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+            
+            try:
+                encoded = orjson.dumps(data, default=str, option=option)
+            except orjson.JSONEncodeError:
+                encoded = None  # e.g. integers beyond 64 bits; use the stdlib below
+            
+            if encoded is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(encoded)
+                return True
+        
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
+            # Streamed chunk by chunk, so large digests are never held as one string
+            f.writelines(_json_encoder(indent).iterencode(data))
         
         return True
         
@@ -90,10 +217,23 @@ def save_json(data: Any, filepath: Union[str, Path], indent: int = 2) -> bool:
         return False
 
 
+@lru_cache(maxsize=None)
+def _json_encoder(indent: Optional[int]) -> json.JSONEncoder:
+    """
+    Stdlib JSON encoder for save_json, built once per indent
+    
+    json.dump() constructs a new encoder on every call; save_json streams
+    through the same iterencode() with the setup paid only once.
+    """
+    return json.JSONEncoder(indent=indent, ensure_ascii=False, default=str)
+
+
 def load_json(filepath: Union[str, Path]) -> Optional[Any]:
     """
     Load data from JSON file
     
+    With orjson, files larger than JSON_MMAP_MIN_SIZE are parsed from a memory map.
+    
     Args:
         filepath: Path to JSON file
         
@@ -106,6 +246,15 @@ def load_json(filepath: Union[str, Path]) -> Optional[Any]:
         if not filepath.exists():
             return None
         
+        if ORJSON_AVAILABLE:
+            try:
+                if filepath.stat().st_size > JSON_MMAP_MIN_SIZE:
+                    return _orjson_load_mapped(filepath)
+                return orjson.loads(filepath.read_bytes())
+            except orjson.JSONDecodeError:
+                # Files written by the stdlib may contain NaN/Infinity, which orjson rejects
+                return json.loads(filepath.read_bytes())
+        
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
         
@@ -113,9 +262,167 @@ def load_json(filepath: Union[str, Path]) -> Optional[Any]:
         return None
 
 
+def _orjson_load_mapped(filepath: Union[str, Path]) -> Any:
+    """Parse a JSON file with orjson straight from a read-only memory map"""
+    with open(filepath, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    try:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+    finally:
+        mm.close()
+
+
+def load_json_mmap(filepath: Union[str, Path]) -> Optional[Any]:
+    """
+    Load data from a (large) JSON file through a read-only memory map
+    
+    orjson parses straight from the mapped pages, skipping the copy of the
+    whole file into a bytes object. Without orjson this is load_json.
+    
+    Args:
+        filepath: Path to JSON file
+        
+    Returns:
+        Loaded data or None if failed
+    """
+    if not ORJSON_AVAILABLE:
+        return load_json(filepath)
+    
+    try:
+        return _orjson_load_mapped(filepath)
+    except orjson.JSONDecodeError:
+        # NaN/Infinity written by the stdlib; let load_json handle it
+        return load_json(filepath)
+    except (OSError, ValueError):
+        # Missing, unreadable or empty file (empty files cannot be mapped)
+        return None
+
+
+def append_jsonl(record: Any, filepath: Union[str, Path]) -> bool:
+    """
+    Append one record as a line to a JSON Lines file
+    
+    Args:
+        record: JSON-serializable record
+        filepath: Path to the .jsonl file
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        filepath = Path(filepath)
+        ensure_directory(filepath.parent)
+        
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(record, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME) + b"\n"
+        else:
+            line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+        
+        # O_APPEND makes each single write land at the end, even with several writers
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        
+        return True
+        
+    except Exception:
+        return False
+
+
+def tail_jsonl(filepath: Union[str, Path], n: int = 1, chunk_size: int = 512) -> List[Any]:
+    """
+    Read the last records of a JSON Lines file without parsing the whole file
+    
+    Args:
+        filepath: Path to the .jsonl file
+        n: Number of records to return
+        chunk_size: Bytes read per step backwards from the end of the file
+        
+    Returns:
+        Up to n records, oldest first (empty if the file is missing)
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            data = b""
+            
+            # Read backwards until we hold n complete lines (or the whole file)
+            while position > 0 and data.count(b"\n") <= n:
+                step = min(chunk_size, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+        
+        lines = [line for line in data.splitlines() if line.strip()]
+        if position > 0:
+            lines = lines[1:]  # the first line may be cut off mid-record
+        
+        return [json.loads(line) for line in lines[-n:]]
+        
+    except Exception:
+        return []
+
+
+def save_msgpack(data: Any, filepath: Union[str, Path]) -> bool:
+    """
+    Save data to a MessagePack file (requires msgspec)
+    
+    Unlike pickle, the format is safe to load from untrusted files and readable
+    from other languages; it holds plain dicts, lists, strings and numbers.
+    
+    Args:
+        data: Data to save
+        filepath: Path to save file
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if not MSGSPEC_AVAILABLE:
+        return False
+    
+    try:
+        filepath = Path(filepath)
+        ensure_directory(filepath.parent)
+        
+        encoded = _MSGPACK_ENCODER.encode(data)
+        with open(filepath, 'wb') as f:
+            f.write(encoded)
+        
+        return True
+        
+    except Exception:
+        return False
+
+
+def load_msgpack(filepath: Union[str, Path]) -> Optional[Any]:
+    """
+    Load data from a MessagePack file (requires msgspec)
+    
+    Args:
+        filepath: Path to MessagePack file
+        
+    Returns:
+        Loaded data or None if failed
+    """
+    if not MSGSPEC_AVAILABLE:
+        return None
+    
+    try:
+        with open(filepath, 'rb') as f:
+            return _MSGPACK_DECODER.decode(f.read())
+        
+    except Exception:
+        return None
+
+
 def save_pickle(data: Any, filepath: Union[str, Path]) -> bool:
     """
-    Save data to pickle file
+    Save data to pickle file (prefer save_msgpack for new caches)
     
     Args:
         data: Data to save
@@ -124,6 +431,8 @@ def save_pickle(data: Any, filepath: Union[str, Path]) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    import pickle  # imported on first use; most callers never touch pickle files
+    
     try:
         filepath = Path(filepath)
         ensure_directory(filepath.parent)
@@ -147,6 +456,8 @@ def load_pickle(filepath: Union[str, Path]) -> Optional[Any]:
     Returns:
         Loaded data or None if failed
     """
+    import pickle
+    
     try:
         filepath = Path(filepath)
         
@@ -180,33 +491,33 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
 
 def clean_html(text: str) -> str:
     """Remove HTML tags from text"""
-    import re
-    clean = re.compile('<.*?>')
-    return re.sub(clean, '', text)
+    return _HTML_TAG_RE.sub('', text)
 
 
+@lru_cache(maxsize=8192)
 def extract_arxiv_id(url_or_text: str) -> Optional[str]:
     """
     Extract ArXiv ID from URL or text
     
+    Results are cached, so the same URL seen again across polls skips the regex.
+    
     Args:
         url_or_text: URL or text containing ArXiv ID
         
     Returns:
         ArXiv ID or None if not found
     """
-    # Pattern for ArXiv IDs (both old and new formats)
-    patterns = [
-        r'(?:arxiv:|arXiv:|https?://arxiv\.org/abs/)?(\d{4}\.\d{4,5}(?:v\d+)?)',
-        r'(?:arxiv:|arXiv:|https?://arxiv\.org/abs/)?([a-z-]+(?:\.[A-Z]{2})?/\d{7}(?:v\d+)?)'
-    ]
+    match = _ARXIV_ID_RE.search(url_or_text)
+    if match is None:
+        return None
     
-    for pattern in patterns:
-        match = re.search(pattern, url_or_text)
-        if match:
-            return match.group(1)
+    if match.group('new'):
+        return match.group('new')
     
-    return None
+    # New-style IDs (2101.00001) take precedence over old-style ones (hep-th/9901001),
+    # so only when an old-style ID comes first look further for a new-style one
+    newer = _ARXIV_NEW_ID_RE.search(url_or_text, match.start())
+    return newer.group(0) if newer else match.group('old')
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -222,26 +533,41 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
     i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    if size_bytes >= 1024:
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
     
-    return f"{size_bytes:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
+@lru_cache(maxsize=1024)
 def validate_email(email: str) -> bool:
     """Validate email address format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_url(url: str) -> bool:
     """Validate URL format"""
+    if not isinstance(url, str):
+        # bytes and anything else take the uncached parse, as they always did
+        return _is_valid_url.__wrapped__(url)
+    
+    # urlparse only finds both a scheme and a network location after "scheme://"
+    # (once it has dropped tab and newline characters), so most non-URLs skip the parse
+    if '://' not in url and '\t' not in url and '\r' not in url and '\n' not in url:
+        return False
+    return _is_valid_url(url)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_url(url: str) -> bool:
+    """Parse a URL candidate once; repeated checks of the same URL are cache hits"""
+    from urllib.parse import urlparse
+    
     try:
         result = urlparse(url)
-        return all([result.scheme, result.netloc])
+        return bool(result.scheme and result.netloc)
     except Exception:
         return False
 
@@ -256,17 +582,30 @@ def get_file_age(filepath: Union[str, Path]) -> Optional[timedelta]:
     Returns:
         File age as timedelta or None if file doesn't exist
     """
-    try:
-        filepath = Path(filepath)
-        
-        if not filepath.exists():
-            return None
-        
-        modified_time = datetime.fromtimestamp(filepath.stat().st_mtime)
-        return datetime.now() - modified_time
+    age_seconds = get_file_age_seconds(filepath)
+    if age_seconds is None:
+        return None
+    
+    return timedelta(seconds=age_seconds)
+
+
+def get_file_age_seconds(filepath: Union[str, Path], now: Optional[float] = None) -> Optional[float]:
+    """
+    Get age of file in seconds, from a single stat call
+    
+    Args:
+        filepath: Path to file
+        now: Reference time.time() value (pass one in when checking many files)
         
-    except Exception:
+    Returns:
+        Seconds since the file was modified, or None if it doesn't exist
+    """
+    try:
+        modified = os.stat(filepath).st_mtime
+    except (OSError, ValueError):
         return None
+    
+    return (time.time() if now is None else now) - modified
 
 
 def is_file_recent(filepath: Union[str, Path], max_age_hours: int = 24) -> bool:
@@ -280,25 +619,35 @@ def is_file_recent(filepath: Union[str, Path], max_age_hours: int = 24) -> bool:
     Returns:
         True if file is recent, False otherwise
     """
-    age = get_file_age(filepath)
-    if age is None:
-        return False
-    
-    return age < timedelta(hours=max_age_hours)
+    age_seconds = get_file_age_seconds(filepath)
+    return age_seconds is not None and age_seconds < max_age_hours * 3600
 
 
-def batch_list(items: List[Any], batch_size: int) -> List[List[Any]]:
+def batch_list(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
     """
-    Split list into batches
+    Split items into batches, lazily
+    
+    Returns a one-shot iterator rather than a list (as it did before): wrap it in
+    list() where len(), indexing or a second pass over the batches is needed.
+    A batch_size below 1 raises ValueError immediately, not on first iteration.
     
     Args:
-        items: List to split
+        items: Items to split (any iterable)
         batch_size: Size of each batch
         
     Returns:
-        List of batches
+        Iterator over batches; only the current batch is held in memory
     """
-    return [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    
+    return _iter_batches(iter(items), batch_size)
+
+
+def _iter_batches(iterator: Iterator[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Yield successive batches of batch_size items from an iterator"""
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
 
 
 def deduplicate_papers(papers: List[Dict], key: str = 'arxiv_id') -> List[Dict]:
@@ -312,16 +661,15 @@ def deduplicate_papers(papers: List[Dict], key: str = 'arxiv_id') -> List[Dict]:
     Returns:
         List of unique papers
     """
-    seen = set()
-    unique_papers = []
-    
+    # An insertion-ordered dict is the seen-set and the result in one;
+    # setdefault keeps the first paper for each identifier
+    unique_papers = {}
     for paper in papers:
         identifier = paper.get(key)
-        if identifier and identifier not in seen:
-            seen.add(identifier)
-            unique_papers.append(paper)
+        if identifier:
+            unique_papers.setdefault(identifier, paper)
     
-    return unique_papers
+    return list(unique_papers.values())
 
 
 def merge_configs(base_config: Dict, override_config: Dict) -> Dict:
@@ -337,15 +685,29 @@ def merge_configs(base_config: Dict, override_config: Dict) -> Dict:
     """
     result = base_config.copy()
     
-    for key, value in override_config.items():
-        if isinstance(value, dict) and key in result and isinstance(result[key], dict):
-            result[key] = merge_configs(result[key], value)
-        else:
-            result[key] = value
+    # Walk nested dicts with an explicit stack; only sections that are merged get copied
+    stack = [(result, override_config)]
+    while stack:
+        target, overrides = stack.pop()
+        for key, value in overrides.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                target[key] = current.copy()
+                stack.append((target[key], value))
+            else:
+                target[key] = value
     
     return result
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, caching results for repeated filtering of the same papers"""
+    if not _FROMISOFORMAT_ACCEPTS_Z:
+        value = value.replace('Z', '+00:00')
+    return datetime.fromisoformat(value)
+
+
 def filter_papers_by_date(
     papers: List[Dict],
     start_date: Optional[datetime] = None,
@@ -377,7 +739,7 @@ def filter_papers_by_date(
         try:
             # Parse date string
             if isinstance(paper_date_str, str):
-                paper_date = datetime.fromisoformat(paper_date_str.replace('Z', '+00:00'))
+                paper_date = _parse_iso_datetime(paper_date_str)
             elif isinstance(paper_date_str, datetime):
                 paper_date = paper_date_str
             else:
@@ -398,45 +760,51 @@ def filter_papers_by_date(
     return filtered
 
 
-def create_summary_statistics(papers: List[Dict], summaries: List[Dict]) -> Dict:
+def create_summary_statistics(papers: Iterable[Dict], summaries: Iterable[Any]) -> Dict:
     """
     Create summary statistics for papers and summaries
     
+    Both inputs are consumed in a single pass, so generators work as well as lists.
+    
     Args:
-        papers: List of paper dictionaries
-        summaries: List of summary dictionaries
+        papers: Iterable of paper dictionaries
+        summaries: Iterable of summary dictionaries or summary objects
         
     Returns:
         Statistics dictionary
     """
-    # Count papers by category
-    category_counts = {}
-    for paper in papers:
-        for category in paper.get('categories', []):
-            category_counts[category] = category_counts.get(category, 0) + 1
-    
-    # Count papers by author (top 10)
-    author_counts = {}
+    # Count papers by category and by author
+    total_papers = 0
+    category_counts = Counter()
+    author_counts = Counter()
     for paper in papers:
-        for author in paper.get('authors', []):
-            author_counts[author] = author_counts.get(author, 0) + 1
+        total_papers += 1
+        category_counts.update(paper.get('categories', ()))
+        author_counts.update(paper.get('authors', ()))
     
-    top_authors = sorted(author_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+    # heapq-based top 10; ties keep first-seen order like the stable sort did
+    top_authors = author_counts.most_common(10)
     
     # Summary statistics
-    successful_summaries = sum(1 for s in summaries if s.get('summary'))
-    avg_summary_length = 0
-    if successful_summaries > 0:
-        total_length = sum(len(s.get('summary', '')) for s in summaries if s.get('summary'))
-        avg_summary_length = total_length / successful_summaries
+    total_summaries = 0
+    successful_summaries = 0
+    total_length = 0
+    for s in summaries:
+        total_summaries += 1
+        text = s.get('summary') if isinstance(s, dict) else getattr(s, 'summary', None)
+        if text:
+            successful_summaries += 1
+            total_length += len(text)
+    
+    avg_summary_length = total_length / successful_summaries if successful_summaries else 0
     
     return {
-        'total_papers': len(papers),
-        'total_summaries': len(summaries),
+        'total_papers': total_papers,
+        'total_summaries': total_summaries,
         'successful_summaries': successful_summaries,
-        'summary_success_rate': successful_summaries / len(summaries) if summaries else 0,
+        'summary_success_rate': successful_summaries / total_summaries if total_summaries else 0,
         'avg_summary_length': avg_summary_length,
-        'category_distribution': category_counts,
+        'category_distribution': dict(category_counts),
         'top_authors': top_authors,
         'categories_count': len(category_counts),
         'unique_authors_count': len(author_counts)
@@ -17,6 +17,62 @@ import json
 from datetime import datetime
 from loguru import logger
 
+# Optional fast JSON encoder for json_logs; the stdlib json module is used without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_json(data: dict) -> str:
+    """Encode a log entry as one JSON line (unknown types are stringified)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str)
+
+
+# loguru level names for the standard logging levels, resolved once
+_LEVEL_MAP = {name: logger.level(name).name for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}
+
+# Numeric severities of the standard levels
+_LEVEL_NO = {name: logger.level(name).no for name in _LEVEL_MAP}
+
+# Frames from this file belong to the logging machinery, not to the caller
+_LOGGING_FILE = logging.__file__
+
+# Write buffer for the high-volume log files (loguru's default is line buffering).
+# loguru only flushes it when a sink is removed, so a crash or SIGKILL can lose
+# up to this much of the newest arxiv_bot.log/debug.log output; keep it small
+_FILE_BUFFER_SIZE = 64 * 1024
+
+
+class InterceptHandler(logging.Handler):
+    """Route standard library log records (from third-party libraries) to loguru"""
+    
+    def emit(self, record):
+        # Get corresponding Loguru level if it exists
+        level = _LEVEL_MAP.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+        
+        # Find caller from where the logged message originated; the depth differs
+        # between logger.info(), logger.log(), logger.exception() etc., so it is
+        # walked rather than hard-coded. Start at emit() itself: what
+        # logging.currentframe() returns changed in Python 3.11
+        frame, depth = sys._getframe(1), 1
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
+            frame = frame.f_back
+            depth += 1
+        
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+
+_INTERCEPT_HANDLER = InterceptHandler()
+
 
 class ArxivLogger:
     """Enhanced logging for ArXiv Bot"""
@@ -55,17 +111,36 @@ class ArxivLogger:
         # Configure loguru
         self._configure_loguru()
         
+        # Lowest level any of our sinks accepts (the error log takes ERROR and up);
+        # the log_* helpers below skip building messages for levels below it
+        sink_levels = []
+        if self.log_to_console:
+            sink_levels.append(self.log_level)
+        if self.log_to_file:
+            sink_levels.extend([self.log_level, "ERROR"])
+        self._min_level_no = min((logger.level(name).no for name in sink_levels), default=float("inf"))
+        
         # Configure standard library logging to use loguru
         self._configure_stdlib_logging()
     
     def _configure_loguru(self) -> None:
-        """Configure loguru logger"""
+        """
+        Configure loguru logger
+        
+        Every sink uses enqueue=True: the calling thread still formats each record
+        (including _json_formatter), but the write is queued and done by a
+        background thread, keeping file and console I/O off the digest path.
+        The main and debug log files are block-buffered (up to _FILE_BUFFER_SIZE is
+        written only by close()); the error log stays line-buffered so errors reach
+        disk immediately.
+        """
         # Console logging
         if self.log_to_console:
             if self.json_logs:
                 logger.add(
                     sys.stdout,
                     level=self.log_level,
+                    enqueue=True,
                     format=self._json_formatter,
                     serialize=False
                 )
@@ -73,6 +148,7 @@ class ArxivLogger:
                 logger.add(
                     sys.stdout,
                     level=self.log_level,
+                    enqueue=True,
                     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
                            "<level>{level: <8}</level> | "
                            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
@@ -87,6 +163,9 @@ class ArxivLogger:
                 logger.add(
                     self.log_dir / "arxiv_bot.json",
                     level=self.log_level,
+                    enqueue=True,
+                    catch=True,
+                    buffering=_FILE_BUFFER_SIZE,
                     format=self._json_formatter,
                     rotation="1 day",
                     retention="30 days",
@@ -96,6 +175,9 @@ class ArxivLogger:
                 logger.add(
                     self.log_dir / "arxiv_bot.log",
                     level=self.log_level,
+                    enqueue=True,
+                    catch=True,
+                    buffering=_FILE_BUFFER_SIZE,
                     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
                     rotation="1 day",
                     retention="30 days"
@@ -105,6 +187,8 @@ class ArxivLogger:
             logger.add(
                 self.log_dir / "errors.log",
                 level="ERROR",
+                enqueue=True,
+                catch=True,
                 format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
                 rotation="1 week",
                 retention="12 weeks"
@@ -115,13 +199,22 @@ class ArxivLogger:
                 logger.add(
                     self.log_dir / "debug.log",
                     level="DEBUG",
+                    enqueue=True,
+                    catch=True,
+                    buffering=_FILE_BUFFER_SIZE,
                     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
                     rotation="6 hours",
                     retention="7 days"
                 )
     
     def _json_formatter(self, record) -> str:
-        """Format log record as JSON"""
+        """
+        Format log record as JSON
+        
+        loguru treats the returned string as a format template, so the encoded
+        line is passed through record["extra"] instead of being returned directly
+        (its braces would otherwise be parsed as format fields).
+        """
         log_entry = {
             "timestamp": record["time"].isoformat(),
             "level": record["level"].name,
@@ -140,32 +233,19 @@ class ArxivLogger:
                 "traceback": record["exception"].traceback
             }
         
-        # Add extra fields if present
-        if "extra" in record:
-            log_entry.update(record["extra"])
+        # Add extra fields if present (skipping the line a previous sink stored)
+        extra = record["extra"]
+        if extra:
+            log_entry.update((key, value) for key, value in extra.items() if key != "serialized")
         
-        return json.dumps(log_entry)
+        extra["serialized"] = _dumps_json(log_entry)
+        return "{extra[serialized]}\n"
     
     def _configure_stdlib_logging(self) -> None:
         """Configure standard library logging to use loguru"""
-        class InterceptHandler(logging.Handler):
-            def emit(self, record):
-                # Get corresponding Loguru level if it exists
-                try:
-                    level = logger.level(record.levelname).name
-                except ValueError:
-                    level = record.levelno
-                
-                # Find caller from where the logged message originated
-                frame, depth = logging.currentframe(), 2
-                while frame.f_code.co_filename == logging.__file__:
-                    frame = frame.f_back
-                    depth += 1
-                
-                logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
-        
-        # Replace all handlers with InterceptHandler
-        logging.basicConfig(handlers=[InterceptHandler()], level=0)
+        # Replace all handlers with InterceptHandler (basicConfig is a no-op once
+        # the root logger has a handler, so reconfiguring never stacks a second one)
+        logging.basicConfig(handlers=[_INTERCEPT_HANDLER], level=0)
         
         # Set levels for common loggers
         logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -174,6 +254,23 @@ class ArxivLogger:
         logging.getLogger("transformers").setLevel(logging.WARNING)
         logging.getLogger("telegram").setLevel(logging.INFO)
     
+    def is_enabled(self, level: str) -> bool:
+        """Check whether records at a level reach any configured sink"""
+        return _LEVEL_NO[level] >= self._min_level_no
+    
+    def flush(self) -> None:
+        """
+        Wait until the background sink queue has handed every pending record to its sink
+        
+        Buffered log files may still hold the newest records; use close() at shutdown.
+        """
+        logger.complete()
+    
+    def close(self) -> None:
+        """Drain the sink queue and close every sink, flushing buffered log files"""
+        logger.complete()
+        logger.remove()
+    
     def get_logger(self, name: Optional[str] = None) -> "logger":
         """Get a logger instance"""
         if name:
@@ -182,6 +279,9 @@ class ArxivLogger:
     
     def log_function_call(self, func_name: str, args: dict = None, kwargs: dict = None) -> None:
         """Log function call with parameters"""
+        if not self.is_enabled("DEBUG"):
+            return
+        
         logger.debug(
             f"Function call: {func_name}",
             extra={
@@ -193,6 +293,9 @@ class ArxivLogger:
     
     def log_performance(self, operation: str, duration: float, success: bool = True, **kwargs) -> None:
         """Log performance metrics"""
+        if not self.is_enabled("INFO"):
+            return
+        
         logger.info(
             f"Performance: {operation} took {duration:.2f}s",
             extra={
@@ -207,6 +310,9 @@ class ArxivLogger:
     
     def log_error_with_context(self, error: Exception, context: dict = None) -> None:
         """Log error with additional context"""
+        if not self.is_enabled("ERROR"):
+            return
+        
         logger.error(
             f"Error occurred: {str(error)}",
             extra={
@@ -217,6 +323,9 @@ class ArxivLogger:
     
     def log_paper_processing(self, paper_id: str, action: str, status: str, **kwargs) -> None:
         """Log paper processing events"""
+        if not self.is_enabled("INFO"):
+            return
+        
         logger.info(
             f"Paper {action}: {paper_id} - {status}",
             extra={
@@ -231,6 +340,9 @@ class ArxivLogger:
     
     def log_notification_sent(self, notification_type: str, recipient: str, success: bool, paper_count: int = 0) -> None:
         """Log notification events"""
+        if not self.is_enabled("INFO"):
+            return
+        
         logger.info(
             f"Notification sent via {notification_type} to {recipient}: {'Success' if success else 'Failed'}",
             extra={
@@ -245,6 +357,9 @@ class ArxivLogger:
     
     def log_scheduler_event(self, job_id: str, action: str, next_run: Optional[datetime] = None) -> None:
         """Log scheduler events"""
+        if not self.is_enabled("INFO"):
+            return
+        
         logger.info(
             f"Scheduler: {action} job '{job_id}'",
             extra={